@@ -1,14 +1,35 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
-from nba_client import get_team_stats
+from fastapi.responses import ORJSONResponse
+from nba_client import configure_nba_http, get_team_stats
 from cache import cached_response
 
-app = FastAPI(title="ALTERAPICKS NBA API")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One pooled client per worker, shared by every request
+    app.state.nba_http = configure_nba_http()
+    yield
+    await app.state.nba_http.aclose()
+
+
+app = FastAPI(
+    title="ALTERAPICKS NBA API",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 @app.get("/health")
-def health():
+async def health():
     return {"status": "ok"}
 
+def _team_stats_policy(arguments):
+    # last_n_games=0 is the full season, which moves slowly
+    return "long" if arguments["last_n_games"] == 0 else "normal"
+
+
 @app.get("/team/{team_id}/stats")
-@cached_response(ttl=3600)
-def team_stats(team_id: int, last_n_games: int = 5):
-    return get_team_stats(team_id, last_n_games)
+@cached_response(policy=_team_stats_policy)
+async def team_stats(team_id: int, last_n_games: int = 5):
+    return await get_team_stats(app.state.nba_http, team_id, last_n_games)
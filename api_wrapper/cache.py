@@ -1,24 +1,157 @@
+import os
 import time
+import asyncio
+import inspect
+import pickle
 from functools import wraps
+from hashlib import blake2b
 
+try:
+    import redis.asyncio as redis
+except ImportError:
+    redis = None
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+# Last good response is kept this long so upstream failures can still be served
+STALE_TTL = 24 * 3600
+
+# (min_ttl, max_ttl) seconds per data volatility class. Within the band the
+# TTL grows with how long the response took to build - slow upstream means
+# stats.nba.com is under load, so hold results longer.
+POLICIES = {
+    "short": (10, 60),      # injuries / news
+    "normal": (60, 300),    # last-N-games splits
+    "long": (300, 3600),    # season-wide aggregates
+}
+GEN_TIME_FACTOR = 60
+
+# Shared across uvicorn workers when REDIS_URL is set (run the server with
+# maxmemory-policy allkeys-lfu). Without Redis, entries go to a diskcache
+# under CACHE_DIR so they survive Render restarts; _cache is the last resort.
+CACHE_DIR = os.environ.get("CACHE_DIR", "/tmp/altera_cache")
+
+_redis = redis.Redis.from_url(os.environ["REDIS_URL"]) if redis and os.environ.get("REDIS_URL") else None
+_disk = (
+    diskcache.Cache(CACHE_DIR, disk_pickle_protocol=pickle.HIGHEST_PROTOCOL)
+    if _redis is None and diskcache is not None else None
+)
 _cache = {}
+_inflight = {}
+
+
+def _make_key(name, arguments):
+    if _redis is None and _disk is None:
+        # In-process keys stay a plain tuple of signature-ordered items;
+        # hashing that is cheaper than repr + blake2b on every hit
+        return (name, arguments)
+
+    raw = repr((name, arguments)).encode()
+    return "cache:" + blake2b(raw, digest_size=16).hexdigest()
+
+
+def _stale_key(key):
+    return key + ":stale" if isinstance(key, str) else key + ("stale",)
+
+
+async def _cache_get(key):
+    if _redis is not None:
+        try:
+            blob = await _redis.get(key)
+        except redis.RedisError:
+            return None
+        return None if blob is None else pickle.loads(blob)
+
+    if _disk is not None:
+        # diskcache drops expired entries itself; its file and SQLite I/O
+        # runs off the event loop
+        return await asyncio.to_thread(_disk.get, key)
+
+    entry = _cache.get(key)
+    if entry is None:
+        return None
 
-def cached_response(ttl=3600):
+    value, expires_at = entry
+    if time.time() >= expires_at:
+        _cache.pop(key, None)
+        return None
+    return value
+
+
+def _effective_ttl(policy, gen_time):
+    min_ttl, max_ttl = POLICIES[policy]
+    return int(min(max(min_ttl + gen_time * GEN_TIME_FACTOR, min_ttl), max_ttl))
+
+
+async def _cache_set(key, value, ttl):
+    if _redis is not None:
+        try:
+            await _redis.set(key, pickle.dumps(value, pickle.HIGHEST_PROTOCOL), ex=ttl)
+        except redis.RedisError:
+            pass
+        return
+
+    if _disk is not None:
+        await asyncio.to_thread(_disk.set, key, value, expire=ttl)
+        return
+
+    _cache[key] = (value, time.time() + ttl)
+
+
+def cached_response(ttl=3600, policy=None):
+    """
+    policy: name in POLICIES, or a callable taking the bound arguments dict
+    and returning one. When set, the TTL is derived per response and `ttl`
+    is ignored.
+    """
     def decorator(func):
+        sig = inspect.signature(func)
+
         @wraps(func)
-        def wrapper(*args, **kwargs):
-            key = (func.__name__, args, frozenset(kwargs.items()))
-            now = time.time()
+        async def wrapper(*args, **kwargs):
+            # Bind to the signature so positional/keyword/defaulted forms of
+            # the same call share one entry
+            bound = sig.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = _make_key(func.__name__, tuple(bound.arguments.items()))
+
+            value = await _cache_get(key)
+            if value is not None:
+                return value
+
+            # Single-flight: concurrent misses for the same key await one
+            # upstream call instead of each hitting stats.nba.com
+            task = _inflight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(_refresh(key, bound, args, kwargs))
+                _inflight[key] = task
+                task.add_done_callback(lambda _: _inflight.pop(key, None))
 
-            if key in _cache:
-                value, timestamp = _cache[key]
-                if now - timestamp < ttl:
-                    return value
+            # Shielded so a disconnecting client doesn't cancel shared work
+            return await asyncio.shield(task)
 
-            result = func(*args, **kwargs)
-            _cache[key] = (result, now)
+        async def _refresh(key, bound, args, kwargs):
+            started = time.perf_counter()
+            try:
+                result = await func(*args, **kwargs)
+            except Exception:
+                # Stale-while-error: NBA rate limits / Render cold starts
+                stale = await _cache_get(_stale_key(key))
+                if stale is None:
+                    raise
+                return stale
+
+            entry_ttl = ttl
+            if policy is not None:
+                name = policy(bound.arguments) if callable(policy) else policy
+                entry_ttl = _effective_ttl(name, time.perf_counter() - started)
+
+            await _cache_set(key, result, entry_ttl)
+            await _cache_set(_stale_key(key), result, STALE_TTL)
             return result
 
         return wrapper
     return decorator
-
@@ -1,11 +1,14 @@
+import asyncio
 import time
-from nba_api.stats.endpoints import leaguedashteamstats
-from nba_api.library.http import HTTPRequest
+
+import httpx
+
+__all__ = ["configure_nba_http", "get_team_stats"]
 
 # --------------------------------------------------
 # NBA anti-bot headers (REQUIRED in cloud)
 # --------------------------------------------------
-HTTPRequest.DEFAULT_HEADERS = {
+NBA_HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
     "Accept": "application/json, text/plain, */*",
     "Accept-Language": "en-US,en;q=0.9",
@@ -19,59 +22,159 @@ HTTPRequest.DEFAULT_HEADERS = {
 # --------------------------------------------------
 SEASON = "2025-26"
 SEASON_TYPE = "Regular Season"
-API_SLEEP = 0.6
+MAX_CONCURRENT_PULLS = 3
+MAX_PULLS_PER_SECOND = 5
+STATS_URL = "https://stats.nba.com/stats/leaguedashteamstats"
+
+MEASURES = {
+    "advanced": "Advanced",
+    "traditional": "Base",
+    "four_factors": "Four Factors",
+    "misc": "Misc",
+    "scoring": "Scoring",
+    "opponent": "Opponent",
+    "shooting": "Shooting",
+}
+
+# Everything nba_api's LeagueDashTeamStats would send, built once; only
+# MeasureType / TeamID / LastNGames vary per request
+BASE_PARAMS = {
+    "PerMode": "Per100Possessions",
+    "PlusMinus": "N",
+    "PaceAdjust": "Y",
+    "Rank": "N",
+    "Season": SEASON,
+    "SeasonType": SEASON_TYPE,
+    "Month": 0,
+    "OpponentTeamID": 0,
+    "Period": 0,
+    "LeagueID": "00",
+    "Outcome": "",
+    "Location": "",
+    "SeasonSegment": "",
+    "DateFrom": "",
+    "DateTo": "",
+    "VsConference": "",
+    "VsDivision": "",
+    "Conference": "",
+    "Division": "",
+    "GameSegment": "",
+    "ShotClockRange": "",
+    "GameScope": "",
+    "PlayerExperience": "",
+    "PlayerPosition": "",
+    "StarterBench": "",
+    "TwoWay": "",
+    "PORound": "",
+}
+
+
+# --------------------------------------------------
+# Rate limiting
+# --------------------------------------------------
+class _TokenBucket:
+    """
+    Async token bucket shared by every pull in this worker.
+    Only waits when the request rate actually exceeds the budget,
+    so idle periods (cache hits, cold start) cost nothing.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return self
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+# Caps in-flight stats.nba.com requests across all callers in this worker
+_pull_slots = asyncio.Semaphore(MAX_CONCURRENT_PULLS)
+# Caps the request rate (stats.nba.com throttles bursts)
+_limiter = _TokenBucket(rate=MAX_PULLS_PER_SECOND, capacity=MAX_PULLS_PER_SECOND)
 
 
 # --------------------------------------------------
 # Helpers
 # --------------------------------------------------
-def _sleep():
-    time.sleep(API_SLEEP)
+def _index_rows(result_set: dict, column: str):
+    headers = result_set["headers"]
+    col_idx = headers.index(column)
+    return headers, {row[col_idx]: row for row in result_set["rowSet"]}
 
 
-def _get_team_row(df, team_id: int):
-    row = df[df["TEAM_ID"] == team_id]
-    if row.empty:
+def _get_team_row(result_set: dict, team_id: int):
+    headers, by_team = _index_rows(result_set, "TEAM_ID")
+
+    row = by_team.get(team_id)
+    if row is None:
         raise RuntimeError("Team not found in NBA API response")
-    return row.iloc[0]
+    return dict(zip(headers, row))
 
 
-def _pull_measure(team_id: int, last_n_games: int, measure_type: str):
-    _sleep()
+async def _pull_measure(client, team_id: int, last_n_games: int, measure_type: str):
+    params = {
+        **BASE_PARAMS,
+        "MeasureType": measure_type,
+        "TeamID": team_id,
+        "LastNGames": last_n_games,
+    }
 
-    dash = leaguedashteamstats.LeagueDashTeamStats(
-        season=SEASON,
-        season_type_all_star=SEASON_TYPE,
-        team_id_nullable=team_id,
-        last_n_games=last_n_games,
-        pace_adjust="Y",
-        per_mode_detailed="Per100Possessions",
-        measure_type_detailed=measure_type
-    )
+    async with _pull_slots, _limiter:
+        resp = await client.get(STATS_URL, params=params)
+    resp.raise_for_status()
 
-    df = dash.get_data_frames()[0]
-    return dict(_get_team_row(df, team_id))
+    data = resp.json()
+    return _get_team_row(data["resultSets"][0], team_id)
 
 
 # --------------------------------------------------
 # PUBLIC API
 # --------------------------------------------------
-def get_team_stats(team_id: int, last_n_games: int = 5):
+_client = None
+
+
+def configure_nba_http():
+    """
+    Create the shared stats.nba.com client with the anti-bot headers.
+    Called from the app lifespan; repeat calls reuse the open client.
+    """
+    global _client
+
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(headers=NBA_HEADERS, http2=True, timeout=30)
+    return _client
+
+
+async def get_team_stats(client, team_id: int, last_n_games: int = 5):
     """
     Mirrors NBA.com Team Stats with:
     - Last N Games
     - Pace Adjust ON
+
+    `client` is the shared httpx.AsyncClient created in the app lifespan.
     """
 
+    results = await asyncio.gather(*[
+        _pull_measure(client, team_id, last_n_games, measure_type)
+        for measure_type in MEASURES.values()
+    ])
+
     return {
         "team_id": team_id,
         "last_n_games": last_n_games,
-
-        "advanced": _pull_measure(team_id, last_n_games, "Advanced"),
-        "traditional": _pull_measure(team_id, last_n_games, "Base"),
-        "four_factors": _pull_measure(team_id, last_n_games, "Four Factors"),
-        "misc": _pull_measure(team_id, last_n_games, "Misc"),
-        "scoring": _pull_measure(team_id, last_n_games, "Scoring"),
-        "opponent": _pull_measure(team_id, last_n_games, "Opponent"),
-        "shooting": _pull_measure(team_id, last_n_games, "Shooting"),
+        **dict(zip(MEASURES, results)),
     }
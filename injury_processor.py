@@ -3,79 +3,121 @@ ESPN Injury Data Processor
 Pure availability pipeline - NO statistical modifications allowed
 """
 
+import orjson
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Optional
 from datetime import datetime
 
 
+# ESPN Team ID mapping (NBA team name → ESPN ID)
+ESPN_TEAM_MAP = MappingProxyType({
+    'Atlanta Hawks': 1,
+    'Boston Celtics': 2,
+    'Brooklyn Nets': 17,
+    'Charlotte Hornets': 30,
+    'Chicago Bulls': 4,
+    'Cleveland Cavaliers': 5,
+    'Dallas Mavericks': 6,
+    'Denver Nuggets': 7,
+    'Detroit Pistons': 8,
+    'Golden State Warriors': 9,
+    'Houston Rockets': 10,
+    'Indiana Pacers': 11,
+    'Los Angeles Clippers': 12,
+    'Los Angeles Lakers': 13,
+    'Memphis Grizzlies': 29,
+    'Miami Heat': 14,
+    'Milwaukee Bucks': 15,
+    'Minnesota Timberwolves': 16,
+    'New Orleans Pelicans': 3,
+    'New York Knicks': 18,
+    'Oklahoma City Thunder': 25,
+    'Orlando Magic': 19,
+    'Philadelphia 76ers': 20,
+    'Phoenix Suns': 21,
+    'Portland Trail Blazers': 22,
+    'Sacramento Kings': 23,
+    'San Antonio Spurs': 24,
+    'Toronto Raptors': 28,
+    'Utah Jazz': 26,
+    'Washington Wizards': 27
+})
+
+# Status conversion rules (ESPN → Model)
+STATUS_RULES = MappingProxyType({
+    'OUT': MappingProxyType({
+        'model_status': 'unavailable',
+        'apply_impact': True
+    }),
+    'DOUBTFUL': MappingProxyType({
+        'model_status': 'unavailable',
+        'apply_impact': True
+    }),
+    'QUESTIONABLE': MappingProxyType({
+        'model_status': 'available',
+        'apply_impact': False  # CRITICAL: No impact for questionable
+    }),
+    'PROBABLE': MappingProxyType({
+        'model_status': 'available',
+        'apply_impact': True
+    }),
+    'ACTIVE': MappingProxyType({
+        'model_status': 'available',
+        'apply_impact': True
+    })
+})
+
+# Status lookup keyed by every uppercased ESPN variant we see, so the common
+# case is a single dict hit instead of substring scans
+_STATUS_LOOKUP = MappingProxyType({
+    **STATUS_RULES,
+    'OUT FOR SEASON': STATUS_RULES['OUT'],
+    'OUT (NO TIMETABLE)': STATUS_RULES['OUT'],
+    'DAY-TO-DAY': STATUS_RULES['QUESTIONABLE'],
+    'DAY TO DAY': STATUS_RULES['QUESTIONABLE'],
+})
+
+
 class InjuryProcessor:
     """
     Processes ESPN injury data into clean availability status
     DOES NOT modify team statistics or projections
     """
 
-    # ESPN Team ID mapping (NBA team name → ESPN ID)
-    ESPN_TEAM_MAP = {
-        'Atlanta Hawks': 1,
-        'Boston Celtics': 2,
-        'Brooklyn Nets': 17,
-        'Charlotte Hornets': 30,
-        'Chicago Bulls': 4,
-        'Cleveland Cavaliers': 5,
-        'Dallas Mavericks': 6,
-        'Denver Nuggets': 7,
-        'Detroit Pistons': 8,
-        'Golden State Warriors': 9,
-        'Houston Rockets': 10,
-        'Indiana Pacers': 11,
-        'Los Angeles Clippers': 12,
-        'Los Angeles Lakers': 13,
-        'Memphis Grizzlies': 29,
-        'Miami Heat': 14,
-        'Milwaukee Bucks': 15,
-        'Minnesota Timberwolves': 16,
-        'New Orleans Pelicans': 3,
-        'New York Knicks': 18,
-        'Oklahoma City Thunder': 25,
-        'Orlando Magic': 19,
-        'Philadelphia 76ers': 20,
-        'Phoenix Suns': 21,
-        'Portland Trail Blazers': 22,
-        'Sacramento Kings': 23,
-        'San Antonio Spurs': 24,
-        'Toronto Raptors': 28,
-        'Utah Jazz': 26,
-        'Washington Wizards': 27
-    }
-
-    # Status conversion rules (ESPN → Model)
-    STATUS_RULES = {
-        'OUT': {
-            'model_status': 'unavailable',
-            'apply_impact': True
-        },
-        'DOUBTFUL': {
-            'model_status': 'unavailable',
-            'apply_impact': True
-        },
-        'QUESTIONABLE': {
-            'model_status': 'available',
-            'apply_impact': False  # CRITICAL: No impact for questionable
-        },
-        'PROBABLE': {
-            'model_status': 'available',
-            'apply_impact': True
-        },
-        'ACTIVE': {
-            'model_status': 'available',
-            'apply_impact': True
-        }
-    }
+    # Concurrent ESPN roster fetches for multi-team sweeps
+    MAX_FETCH_WORKERS = 10
+
+    # (connect, read) seconds per roster request
+    REQUEST_TIMEOUT = (3, 10)
+
+    # Kept as class attributes for existing callers
+    ESPN_TEAM_MAP = ESPN_TEAM_MAP
+    STATUS_RULES = STATUS_RULES
+
+    def __init__(self, session: Optional[requests.Session] = None):
+        """
+        Initialize injury processor
 
-    def __init__(self):
-        """Initialize injury processor"""
+        Args:
+            session: Shared requests session to reuse (e.g. the engine's);
+                a private pooled one is created if omitted
+        """
         self.base_url = "http://site.api.espn.com/apis/site/v2/sports/basketball/nba/teams"
 
+        # Keep-alive session so every team after the first reuses the ESPN connection
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        self._session = session
+
+        # {espn_id: (etag, injuries)} - lets ESPN answer 304 when a roster is unchanged
+        self._roster_cache = {}
+
     def get_espn_team_id(self, nba_team_name: str) -> Optional[int]:
         """
         Get ESPN team ID from NBA team name
@@ -86,7 +128,7 @@ class InjuryProcessor:
         Returns:
             ESPN team ID or None if not found
         """
-        return self.ESPN_TEAM_MAP.get(nba_team_name)
+        return ESPN_TEAM_MAP.get(nba_team_name)
 
     def fetch_team_injuries(self, nba_team_name: str) -> List[Dict]:
         """
@@ -96,8 +138,16 @@ class InjuryProcessor:
             nba_team_name: Full NBA team name
 
         Returns:
-            List of player injury objects
+            List of player injury objects (empty if the fetch failed)
         """
+        try:
+            return self._fetch_team_injuries(nba_team_name)
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
+            print(f"Error fetching injuries for {nba_team_name}: {e}")
+            return []
+
+    def _fetch_team_injuries(self, nba_team_name: str) -> List[Dict]:
+        """fetch_team_injuries without the error handling (raises on failure)"""
         espn_id = self.get_espn_team_id(nba_team_name)
 
         if espn_id is None:
@@ -106,36 +156,32 @@ class InjuryProcessor:
 
         url = f"{self.base_url}/{espn_id}/roster"
 
-        try:
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-
-            injuries = []
-
-            for player in data.get('athletes', []):
-                player_name = player.get('displayName', '')
-                player_status = player.get('status', {}).get('name', 'ACTIVE')
-                player_injuries = player.get('injuries', [])
-
-                # If player has injury data, use most recent injury status
-                if player_injuries:
-                    # ESPN injury format: [{'status': 'Out', 'date': '2025-12-06T01:16Z'}]
-                    most_recent_injury = player_injuries[0]
-                    injury_status = most_recent_injury.get('status', 'ACTIVE').upper()
-                    injury_date = most_recent_injury.get('date', '')
-
-                    injuries.append({
-                        'player_name': player_name,
-                        'espn_status': injury_status,
-                        'injury_date': injury_date
-                    })
+        cached = self._roster_cache.get(espn_id)
+        headers = {'If-None-Match': cached[0]} if cached else None
+
+        response = self._session.get(url, headers=headers, timeout=self.REQUEST_TIMEOUT)
+        if response.status_code == 304 and cached:
+            return cached[1]
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+
+        # ESPN injury format: [{'status': 'Out', 'date': '2025-12-06T01:16Z'}]
+        # Only players with injury data are kept; use most recent injury status
+        injuries = [
+            {
+                'player_name': player.get('displayName', ''),
+                'espn_status': player['injuries'][0].get('status', 'ACTIVE').upper(),
+                'injury_date': player['injuries'][0].get('date', '')
+            }
+            for player in data.get('athletes', ())
+            if player.get('injuries')
+        ]
 
-            return injuries
+        etag = response.headers.get('ETag')
+        if etag:
+            self._roster_cache[espn_id] = (etag, injuries)
 
-        except requests.RequestException as e:
-            print(f"Error fetching injuries for {nba_team_name}: {e}")
-            return []
+        return injuries
 
     def process_injury_status(self, espn_status: str) -> Dict[str, any]:
         """
@@ -150,20 +196,21 @@ class InjuryProcessor:
         # Normalize status
         espn_status_upper = espn_status.upper()
 
-        # Handle variations
-        if 'OUT' in espn_status_upper:
-            espn_status_upper = 'OUT'
-        elif 'DAY-TO-DAY' in espn_status_upper or 'DAY TO DAY' in espn_status_upper:
-            # Day-to-Day typically means questionable
-            espn_status_upper = 'QUESTIONABLE'
+        rule = _STATUS_LOOKUP.get(espn_status_upper)
 
-        # Get status rule or default to ACTIVE
-        rule = self.STATUS_RULES.get(espn_status_upper, self.STATUS_RULES['ACTIVE'])
+        # Handle unlisted variations
+        if rule is None:
+            if 'OUT' in espn_status_upper:
+                rule = STATUS_RULES['OUT']
+            elif 'DAY-TO-DAY' in espn_status_upper or 'DAY TO DAY' in espn_status_upper:
+                # Day-to-Day typically means questionable
+                rule = STATUS_RULES['QUESTIONABLE']
+            else:
+                # Default to ACTIVE
+                rule = STATUS_RULES['ACTIVE']
 
-        return {
-            'model_status': rule['model_status'],
-            'apply_impact': rule['apply_impact']
-        }
+        # Copy so callers can't edit the shared rule table
+        return dict(rule)
 
     def generate_injury_report(self, nba_team_name: str) -> Dict:
         """
@@ -173,9 +220,15 @@ class InjuryProcessor:
             nba_team_name: Full NBA team name
 
         Returns:
-            Clean injury report with availability status
+            Clean injury report with availability status; fetch_failed is
+            True when ESPN couldn't be read and the report is empty
         """
-        injuries = self.fetch_team_injuries(nba_team_name)
+        try:
+            injuries = self._fetch_team_injuries(nba_team_name)
+            fetch_failed = False
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
+            print(f"Error fetching injuries for {nba_team_name}: {e}")
+            injuries, fetch_failed = [], True
 
         injury_report = []
 
@@ -196,9 +249,34 @@ class InjuryProcessor:
         return {
             'team': nba_team_name,
             'injury_report': injury_report,
-            'report_timestamp': datetime.now().isoformat()
+            'report_timestamp': datetime.now().isoformat(),
+            'fetch_failed': fetch_failed
         }
 
+    def generate_all_reports(self, nba_team_names: List[str]) -> Dict[str, Dict]:
+        """
+        Generate injury reports for several teams concurrently
+
+        Each team is a separate ESPN roster request, so the fetches run on a
+        thread pool and total time tracks the slowest request, not the sum
+
+        Args:
+            nba_team_names: Full NBA team names
+
+        Returns:
+            Dict mapping team name to its injury report
+        """
+        team_names = list(dict.fromkeys(nba_team_names))
+
+        if not team_names:
+            return {}
+
+        workers = min(self.MAX_FETCH_WORKERS, len(team_names))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            reports = executor.map(self.generate_injury_report, team_names)
+            return dict(zip(team_names, reports))
+
     def get_unavailable_players(self, nba_team_name: str) -> List[str]:
         """
         Get list of unavailable player names for a team
@@ -219,14 +297,16 @@ class InjuryProcessor:
 
         return unavailable
 
-    def print_injury_report(self, nba_team_name: str):
+    def print_injury_report(self, nba_team_name: str, report: Optional[Dict] = None):
         """
         Print formatted injury report
 
         Args:
             nba_team_name: Full NBA team name
+            report: Previously generated report (fetched if not provided)
         """
-        report = self.generate_injury_report(nba_team_name)
+        if report is None:
+            report = self.generate_injury_report(nba_team_name)
 
         print(f"\n{'='*80}")
         print(f"INJURY REPORT: {report['team']}")
@@ -264,10 +344,18 @@ if __name__ == "__main__":
     print("TESTING INJURY PROCESSOR")
     print("="*80)
 
+    # Fetch all teams at once, then print
+    reports = processor.generate_all_reports(test_teams)
+
     for team in test_teams:
-        processor.print_injury_report(team)
+        report = reports[team]
+        processor.print_injury_report(team, report=report)
 
         # Show unavailable players
-        unavailable = processor.get_unavailable_players(team)
+        unavailable = [
+            player['player_name']
+            for player in report['injury_report']
+            if player['model_status'] == 'unavailable'
+        ]
         if unavailable:
             print(f"Unavailable players: {', '.join(unavailable)}\n")
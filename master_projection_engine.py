@@ -14,53 +14,388 @@ STEP 8: Apply rest adjustment (OPTIONAL) → rest-adjusted spread
 STEP 9: Apply pace adjustment (OPTIONAL) → pace-adjusted total
 """
 
+import io
+import logging
+import os
+import re
+import random
 import sys
 import time
+import threading
+import unicodedata
+import httpx
+import orjson
 import requests
+import diskcache
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Tuple
-from datetime import datetime
+from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime, date
 from nba_api.stats.static import teams
+from nba_api.stats.library.http import NBAStatsHTTP
 from nba_api.stats.endpoints import (
     commonteamroster,
+    leaguedashplayerstats,
     playercareerstats
 )
 
+try:
+    from rapidfuzz import process as fuzz_process
+except ImportError:
+    fuzz_process = None
+
+try:
+    import ijson
+    _IJSON_ERRORS = (ijson.JSONError,)
+except ImportError:
+    ijson = None
+    _IJSON_ERRORS = ()
+
+try:
+    from numba import njit
+except ImportError:
+    # numba is optional - the kernels below then run as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Section divider for console output
+_BANNER = "=" * 80
+
+# print_summary line templates
+_SUMMARY_GAME = "Game {i}: {away_team} @ {home_team}"
+_SUMMARY_SPREAD = "  Spread: {favorite_team} {favorite_spread:.1f}"
+_SUMMARY_REST_SPREAD = "  Rest-Adjusted Spread: {team} {spread:.1f}"
+_SUMMARY_REST_DAYS = "    Rest Days: {home}={rest_days_home}d, {away}={rest_days_away}d"
+_SUMMARY_TOTAL = "  Total: {total}"
+_SUMMARY_PACE_TOTAL = "  Pace-Adjusted Total: {pace_module_total:.1f}"
+_SUMMARY_PACE_DELTA = "    Pace Delta: {pace_delta:+.2f} (Adj: {pace_total_adj:+.1f})"
+_SUMMARY_SCORE = "  Score: {home_points}-{away_points}"
+_SUMMARY_INJURY = "    {team}: {adj:+.2f} total adjustment"
+
 # API Wrapper Configuration
 BASE_URL = "https://nba-e6du.onrender.com"
 
-def warm_up_api():
-    try:
-        print("Warming up Render API...")
-        requests.get(f"{BASE_URL}/health", timeout=10)
-        time.sleep(10)  # allow Render + nba_api to fully wake
-    except Exception as e:
-        print(f"Warm-up warning: {e}")
+# One pooled HTTP/2 client for every Render call; keeps the TLS session warm
+# across all dashboard requests in a slate (httpx.Client is thread-safe)
+_render_http = httpx.Client(
+    base_url=BASE_URL,
+    http2=True,
+    timeout=30,
+    limits=httpx.Limits(max_connections=16, max_keepalive_connections=16)
+)
+
+# Retry policy for Render dashboard calls (cold starts, rate limits)
+DASHBOARD_RETRIES = 4
+BACKOFF_FACTOR = 0.5
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+def warm_up_api(max_wait: float = 30.0):
+    """Poll /health until Render answers 200 (returns at once when already warm)"""
+    print("Warming up Render API...")
+    deadline = time.monotonic() + max_wait
+    while time.monotonic() < deadline:
+        try:
+            if _render_http.get("/health", timeout=3).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.5)
+    print(f"Warm-up warning: /health not ready after {max_wait:.0f}s")
+
+# On-disk cache shared by every run on this machine; entries are keyed by
+# calendar date so a new slate always starts from fresh numbers
+CACHE_DIR = os.path.expanduser("~/.nba_cache")
+CACHE_EXPIRE = 6 * 3600
+CACHE_VERSION = 1
+_disk_cache = diskcache.Cache(CACHE_DIR)
+
+
+def _cache_lookup(key):
+    """Return the cached payload for key, or None on miss / version change"""
+    entry = _disk_cache.get(key)
+    if entry is None or entry.get('api_version') != CACHE_VERSION:
+        return None
+    return entry['data']
+
+
+def _cache_store(key, data):
+    _disk_cache.set(key, {
+        'data': data,
+        'fetched_at': datetime.now().isoformat(),
+        'api_version': CACHE_VERSION
+    }, expire=CACHE_EXPIRE)
+
 
 def get_team_dashboard(team_id, last_n):
     if not last_n or last_n <= 0:
         last_n = 5
 
-    url = f"{BASE_URL}/team-dashboard/{team_id}"
+    key = ('team_dashboard', team_id, last_n, date.today().isoformat())
+    cached = _cache_lookup(key)
+    if cached is not None:
+        return cached
+
+    url = f"/team-dashboard/{team_id}"
 
-    for attempt in range(3):
+    for attempt in range(DASHBOARD_RETRIES + 1):
+        retry_after = None
         try:
-            resp = requests.get(
+            resp = _render_http.get(
                 url,
-                params={"last_n_games": last_n},
-                timeout=30
+                params={"last_n_games": last_n}
             )
-            resp.raise_for_status()
-            return resp.json()
+            if resp.status_code not in RETRY_STATUSES:
+                resp.raise_for_status()
+                data = resp.json()
+                _cache_store(key, data)
+                return data
 
-        except requests.exceptions.Timeout:
-            print(f"Retrying team {team_id} (attempt {attempt + 1})")
-            time.sleep(5)
+            reason = f"HTTP {resp.status_code}"
+            retry_after = resp.headers.get("Retry-After")
+
+        except httpx.TransportError as e:  # timeouts, connection resets
+            reason = type(e).__name__
+
+        if attempt == DASHBOARD_RETRIES:
+            break
+
+        # Honor Retry-After (seconds form) when the server sends one,
+        # otherwise exponential backoff with full jitter
+        if retry_after is not None and retry_after.isdigit():
+            delay = float(retry_after)
+        else:
+            delay = random.uniform(0, BACKOFF_FACTOR * 2 ** attempt)
+
+        print(f"Retrying team {team_id} after {reason} (attempt {attempt + 1}, {delay:.1f}s)")
+        time.sleep(delay)
 
     # If we get here, all retries failed
     raise RuntimeError(f"Failed to fetch dashboard for team {team_id}")
 
 
+class TokenBucket:
+    """
+    Thread-safe token bucket. acquire() only blocks when callers exceed
+    `rate` requests per second (bursts up to `capacity`).
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                time.sleep((1 - self._tokens) / self.rate)
+
+
+# Global budget for live stats.nba.com player requests (~5 req/s)
+_career_limiter = TokenBucket(rate=5, capacity=5)
+
+
+def _get_career_df(player_id, season):
+    """
+    Career stats DataFrame for a player, served from the disk cache when
+    already fetched today. Only live fetches draw from the rate limiter.
+
+    Returns:
+        (career_df, from_cache)
+    """
+    key = ('player_career', player_id, season, date.today().isoformat())
+    cached = _cache_lookup(key)
+    if cached is not None:
+        return cached, True
+
+    _career_limiter.acquire()
+    career_stats = playercareerstats.PlayerCareerStats(player_id=player_id)
+    career_df = career_stats.get_data_frames()[0]
+    _cache_store(key, career_df)
+    return career_df, False
+
+
+class _ThreadOutput:
+    """
+    sys.stdout proxy: threads that opened a buffer via _buffered_output()
+    write into it, everything else goes straight to the real stream.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def write(self, text):
+        buffer = getattr(self._local, 'buffer', None)
+        return (self._stream if buffer is None else buffer).write(text)
+
+    def flush(self):
+        self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def _install_output_proxy():
+    """Swap in the thread-aware stdout (main thread, before spawning workers)"""
+    if not isinstance(sys.stdout, _ThreadOutput):
+        sys.stdout = _ThreadOutput(sys.stdout)
+
+
+@contextmanager
+def _buffered_output():
+    """
+    Collect this thread's prints so parallel work doesn't interleave. If the
+    block raises, the collected output is passed on before the error so the
+    lines explaining the failure aren't lost.
+    """
+    local = sys.stdout._local
+    buffer = io.StringIO()
+    previous = getattr(local, 'buffer', None)
+    local.buffer = buffer
+    try:
+        yield buffer
+    except BaseException:
+        local.buffer = previous
+        print(buffer.getvalue(), end='')
+        raise
+    finally:
+        local.buffer = previous
+
+
+def _bind_output(buffer):
+    """Pool initializer: send the worker's prints to its parent's buffer"""
+    if buffer is not None:
+        sys.stdout._local.buffer = buffer
+
+
+def _output_pool(max_workers: int) -> ThreadPoolExecutor:
+    """ThreadPoolExecutor whose workers print into the calling thread's buffer"""
+    local = getattr(sys.stdout, '_local', None)
+    return ThreadPoolExecutor(max_workers=max_workers, initializer=_bind_output,
+                              initargs=(getattr(local, 'buffer', None),))
+
+
+# Per-thread flag a step sets (via _skip_step_memo) when its result is a
+# fallback, so _memoize_team_step leaves it uncached
+_step_memo = threading.local()
+
+
+def _skip_step_memo():
+    """Mark the running step's result as degraded so it isn't memoized"""
+    _step_memo.skip = True
+
+
+def _memoize_team_step(method):
+    """
+    Reuse a per-team step result for the rest of the day (same team, same
+    arguments) so a team appearing twice in a slate isn't recomputed.
+    Results flagged with _skip_step_memo() are returned but not stored, so
+    a later call retries. Cleared by MasterProjectionEngine.reset_cache().
+    """
+    step_label = method.__name__.split('_')[1]
+
+    @wraps(method)
+    def wrapper(self, team_name, *args, **kwargs):
+        key = (method.__name__, team_name, args, tuple(sorted(kwargs.items())), date.today())
+        if key in self._step_cache:
+            print(f"  [STEP {step_label}] Reusing earlier result for {team_name}")
+            return self._step_cache[key]
+
+        _step_memo.skip = False
+        result = method(self, team_name, *args, **kwargs)
+        if not _step_memo.skip:
+            self._step_cache[key] = result
+        return result
+
+    return wrapper
+
+
+# Static team list is constant for the season - load it and build the
+# O(1) lookups (id -> name; lowercased full name / nickname / abbreviation
+# -> id) once per process, shared by every engine instance
+_ALL_TEAMS = teams.get_teams()
+_TEAM_ID_TO_NAME = {t['id']: t['full_name'] for t in _ALL_TEAMS}
+_TEAM_LOOKUP = {}
+for _team in _ALL_TEAMS:
+    for _field in ('full_name', 'nickname', 'abbreviation'):
+        _TEAM_LOOKUP.setdefault(_team[_field].lower(), _team['id'])
+
+# ESPN abbreviation -> full name, covering the ESPN/nba_api mismatches
+_ESPN_TO_NBA_ABBR = {
+    'WSH': 'WAS',  # Washington
+    'UTAH': 'UTA',  # Utah
+    'GS': 'GSW',    # Golden State
+    'SA': 'SAS',    # San Antonio
+    'NY': 'NYK',    # New York
+    'NO': 'NOP'     # New Orleans
+}
+_ESPN_ABBR_TO_FULL = {t['abbreviation']: t['full_name'] for t in _ALL_TEAMS}
+_ESPN_ABBR_TO_FULL.update({
+    espn: _ESPN_ABBR_TO_FULL[nba]
+    for espn, nba in _ESPN_TO_NBA_ABBR.items()
+    if nba in _ESPN_ABBR_TO_FULL
+})
+
+_NON_LETTERS = re.compile(r'[^a-z]')
+
+# Minimum rapidfuzz score for accepting a near-miss player name
+NAME_MATCH_CUTOFF = 92
+
+
+def _canon(name: str) -> str:
+    """Canonical player name: accents stripped, letters only ("P.J. Tucker" -> "pjtucker")"""
+    ascii_name = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode()
+    return _NON_LETTERS.sub('', ascii_name.lower())
+
+
+@njit(cache=True)
+def _project_core(home_off, home_def, away_off, away_def, home_pace, away_pace, home_court_adj):
+    """
+    Step 7 numeric kernel (JIT-compiled when numba is installed; set
+    NUMBA_DISABLE_JIT=1 to force the Python path)
+
+    Returns:
+        (home_points, away_points, possessions)
+    """
+    # Project possessions (simplified - actual model uses more complex formula)
+    possessions = (home_pace + away_pace) / 2
+
+    # Average of team ORtg and opponent DRtg, per 100 possessions
+    per_possession = possessions * 0.005  # (x / 2) / 100 * possessions
+    home_points = (home_off + away_def) * per_possession + home_court_adj
+    away_points = (away_off + home_def) * per_possession
+    return home_points, away_points, possessions
+
+
+@dataclass(slots=True)
+class PipelineResult:
+    """One matchup's output from run_full_pipeline / run_slate"""
+    home_adjusted: Dict
+    away_adjusted: Dict
+    projection: Dict
+    rest_adjustment: Dict = field(default_factory=dict)
+    pace_adjustment: Dict = field(default_factory=dict)
+    home_injury_breakdown: List[Dict] = field(default_factory=list)
+    away_injury_breakdown: List[Dict] = field(default_factory=list)
+
+
 from injury_processor import InjuryProcessor
 from player_stats_processor import PlayerStatsProcessor
 from rest_adjustment_module import RestAdjustmentModule
@@ -75,7 +410,7 @@ try:
         sys.path.insert(0, str(perf_module_path))
 
     from outcome_fetcher import OutcomeFetcher
-    from save_predictions_helper import save_predictions
+    from save_predictions_helper import save_predictions, save_predictions_stream
     PERFORMANCE_TRACKING_ENABLED = True
 except ImportError as e:
     PERFORMANCE_TRACKING_ENABLED = False
@@ -106,13 +441,73 @@ class MasterProjectionEngine:
     # Pace dampening
     PACE_DAMPENING = 0.6
 
+    # Concurrent career-stats fetches per team (rate is capped separately)
+    MAX_CAREER_WORKERS = 4
+
+    # Concurrent team pipelines (steps 1-6) in run_slate / project_all_games
+    MAX_SLATE_TEAM_WORKERS = 8
+
+    # Re-runs within this window reuse the cached ESPN scoreboard outright
+    SCOREBOARD_FRESH_SECONDS = 300
+
+    # Scoreboards larger than this are stream-parsed with ijson (if installed)
+    SCOREBOARD_STREAM_BYTES = 2_000_000
+
+    # (connect, read) seconds for ESPN - fail fast on DNS/handshake stalls
+    ESPN_TIMEOUT = (3, 10)
+
+    # Write predictions game-by-game instead of building the full list first
+    STREAM_PREDICTIONS = False
+
     def __init__(self):
         """Initialize all processors"""
-        self.injury_processor = InjuryProcessor()
+        # Route every nba_api endpoint (roster, career stats, game logs)
+        # through one pooled keep-alive session instead of per-call handshakes
+        nba_session = requests.Session()
+        nba_session.mount("https://", HTTPAdapter(pool_connections=20, pool_maxsize=50))
+        NBAStatsHTTP.set_session(nba_session)
+
+        # Pooled session with retries for ESPN (scoreboard + injury rosters)
+        self.session = requests.Session()
+        espn_adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3,
+                              status_forcelist=[429, 500, 502, 503, 504],
+                              allowed_methods=['GET'])
+        )
+        self.session.mount("http://", espn_adapter)
+        self.session.mount("https://", espn_adapter)
+        # Pin compression explicitly (some proxies strip the default header);
+        # DEFAULT_ACCEPT_ENCODING adds br when the brotli package is installed
+        self.session.headers.update({
+            'Accept-Encoding': DEFAULT_ACCEPT_ENCODING,
+            'User-Agent': 'nba-engine/1.0',
+        })
+
+        self.injury_processor = InjuryProcessor(session=self.session)
         self.player_processor = PlayerStatsProcessor()
         self.rest_module = RestAdjustmentModule(season=self.SEASON)
         self.pace_module = PaceAdjustmentModule(league_avg_pace=self.LEAGUE_AVG_PACE)
-        self.all_teams = teams.get_teams()
+        self.all_teams = _ALL_TEAMS
+
+        # League-wide season totals, fetched once per run (see _get_league_df)
+        self._league_df = None
+        # Set when the league pull fails, so later callers skip straight to
+        # the per-player fallback instead of retrying it one team at a time
+        self._league_error = None
+        self._league_lock = threading.Lock()
+
+        # Per-team results of steps 1-3 (see _memoize_team_step)
+        self._step_cache = {}
+
+        # Injury reports by team name, filled in bulk (see _get_all_injuries)
+        self._injury_cache = {}
+
+        # Set at the start of project_all_games / run_slate; None means
+        # "use the current time" for standalone pipeline calls
+        self._run_timestamp = None
+
         print("✓ Master Projection Engine initialized")
         print("  - Injury Processor loaded")
         print("  - Player Stats Processor loaded")
@@ -122,41 +517,57 @@ class MasterProjectionEngine:
 
     def get_team_name_by_id(self, team_id: int) -> str:
         """Get team name from team ID"""
-        for team in self.all_teams:
-            if team['id'] == team_id:
-                return team['full_name']
-        return "Unknown Team"
+        return _TEAM_ID_TO_NAME.get(team_id, "Unknown Team")
 
     def get_team_id(self, team_name: str) -> int:
         """Get team ID from team name"""
+        key = team_name.lower()
+
+        team_id = _TEAM_LOOKUP.get(key)
+        if team_id is not None:
+            return team_id
+
+        # Partial names ("Lakers" in "Los Angeles Lakers") fall back to a scan
         for team in self.all_teams:
-            if team_name.lower() in team['full_name'].lower() or \
-               team_name.lower() in team['nickname'].lower() or \
-               team_name.lower() in team['abbreviation'].lower():
+            if key in team['full_name'].lower() or \
+               key in team['nickname'].lower() or \
+               key in team['abbreviation'].lower():
                 return team['id']
         raise ValueError(f"Team '{team_name}' not found")
 
-    def step_1_load_baseline_stats(self, team_name: str) -> Dict:
+    def reset_cache(self):
+        """Drop per-team step results and league totals (call between slates)"""
+        self._step_cache.clear()
+        self._injury_cache.clear()
+        with self._league_lock:
+            self._league_df = None
+            self._league_error = None
+
+    @_memoize_team_step
+    def step_1_load_baseline_stats(self, team_name: str, team_id: Optional[int] = None) -> Dict:
         """
         STEP 1: Load baseline team stats (OffRtg, DefRtg, Pace)
 
         Args:
             team_name: Full NBA team name
+            team_id: NBA team ID (resolved from team_name if omitted)
 
         Returns:
             Dict with baseline stats
         """
         print(f"  [STEP 1] Loading baseline stats for {team_name}...")
 
-        team_id = self.get_team_id(team_name)
+        if team_id is None:
+            team_id = self.get_team_id(team_name)
 
-        # Fetch season stats
-        season_data = get_team_dashboard(team_id, last_n=0)
-        team_season = pd.Series(season_data.get('Advanced', {}))
+        # Fetch season + Last 5 stats concurrently (two independent round-trips)
+        with _output_pool(2) as pool:
+            season_future = pool.submit(get_team_dashboard, team_id, 0)
+            last5_future = pool.submit(get_team_dashboard, team_id, 5)
+            season_data, last5_data = season_future.result(), last5_future.result()
 
-        # Fetch Last 5 stats
-        last5_data = get_team_dashboard(team_id, last_n=5)
-        team_last5 = pd.Series(last5_data.get('Advanced', {}))
+        team_season = season_data.get('Advanced', {})
+        team_last5 = last5_data.get('Advanced', {})
 
         # Apply recency weighting
         off_rtg_weighted = (team_last5['OFF_RATING'] * self.LAST5_WEIGHT +
@@ -182,6 +593,25 @@ class MasterProjectionEngine:
 
         return baseline
 
+    def _get_all_injuries(self, team_names: List[str]) -> Dict[str, Dict]:
+        """
+        Injury reports for the given teams, fetching only the ones not yet
+        cached - all of them in one concurrent pass
+
+        Args:
+            team_names: Full NBA team names
+
+        Returns:
+            Dict mapping each requested team name to its injury report
+        """
+        missing = [name for name in team_names if name not in self._injury_cache]
+        fetched = self.injury_processor.generate_all_reports(missing) if missing else {}
+        # Failed fetches are returned but not cached, so the next call retries
+        self._injury_cache.update((name, report) for name, report in fetched.items()
+                                  if not report.get('fetch_failed'))
+        return {name: fetched.get(name) or self._injury_cache[name] for name in team_names}
+
+    @_memoize_team_step
     def step_2_get_injury_report(self, team_name: str, injury_adjustment: bool = True) -> Dict:
         """
         STEP 2: Run injury module → availability flags only (OPTIONAL)
@@ -203,7 +633,9 @@ class MasterProjectionEngine:
 
         print(f"  [STEP 2] Fetching injury report for {team_name}...")
 
-        report = self.injury_processor.generate_injury_report(team_name)
+        report = self._get_all_injuries([team_name])[team_name]
+        if report.get('fetch_failed'):
+            _skip_step_memo()
 
         unavailable_count = sum(1 for p in report['injury_report']
                                if p['model_status'] == 'unavailable')
@@ -213,19 +645,145 @@ class MasterProjectionEngine:
 
         return report
 
-    def step_3_get_player_impacts(self, team_name: str) -> List[Dict]:
+    def _get_league_df(self) -> pd.DataFrame:
+        """
+        Season totals for every player in one LeagueDashPlayerStats request.
+        Shared by both teams in a pipeline run (and the disk cache for the day).
+        A failed pull is re-raised to later callers until reset_cache() or the
+        next run_slate().
+        """
+        with self._league_lock:
+            if self._league_error is not None:
+                raise self._league_error
+            if self._league_df is None:
+                key = ('league_player_stats', self.SEASON, date.today().isoformat())
+                league_df = _cache_lookup(key)
+                if league_df is None:
+                    try:
+                        league_df = leaguedashplayerstats.LeagueDashPlayerStats(
+                            season=self.SEASON,
+                            per_mode_detailed='Totals'
+                        ).get_data_frames()[0]
+                    except Exception as e:
+                        self._league_error = e
+                        raise
+                    _cache_store(key, league_df)
+                self._league_df = league_df
+            return self._league_df
+
+    def _safe_get_career(self, player_id):
+        """
+        Career stats for one player (runs on a worker thread). Only the
+        network call is guarded; callers check the returned frame explicitly.
+
+        Args:
+            player_id: NBA player ID
+
+        Returns:
+            (career_df, None) on success, (None, error message) on failure
+        """
+        try:
+            # Fetch player career stats (disk cache first)
+            career_df, _ = _get_career_df(player_id, self.SEASON)
+        except Exception as e:
+            return None, str(e)[:60]
+        return career_df, None
+
+    def _compute_player_metrics(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Derive usage / net rating / on-court ratings for every player at once
+
+        Args:
+            df: One season row per player (GP, MIN, FGA, FTA, TOV, PTS, FG_PCT)
+
+        Returns:
+            df with usage_rate, net_rating, mpg, off_rating, def_rating added
+        """
+        games = df['GP']
+        minutes = df['MIN']
+        played = games > 0
+
+        # Usage% ≈ (FGA + 0.44*FTA + TOV) / (Team Minutes / 5)
+        # Simplified: (FGA + 0.44*FTA + TOV) / Minutes * 48
+        df['usage_rate'] = ((df['FGA'] + 0.44 * df['FTA'] + df['TOV']) / minutes * 48).where(minutes > 0, 0.0)
+
+        # Net rating approximation: career stats don't have PLUS_MINUS, so
+        # scale PPG - avg scorer (15ppg) = 0, elite (30ppg) = +5
+        df['net_rating'] = ((df['PTS'] / games).where(played, 0.0) - 15) / 3
+
+        # Estimate ON-COURT impact from basic stats (not raw ratings)
+        # These should be small differentials (±3 to ±8 range), not full ratings
+        ppg = (df['PTS'] / games).where(played, 15.0)
+        scoring_efficiency = (df['FG_PCT'].fillna(0.45) - 0.45) * 10  # FG% above/below average
+        volume_bonus = np.minimum((ppg - 15) / 5, 3)  # Bonus for high scoring (capped at +3)
+
+        # Convert to "on-court rating" format (league avg + impact)
+        # Defense splits net rating 60/40 between offense and defense
+        df['off_rating'] = self.LEAGUE_AVG_OFF_RATING + scoring_efficiency + volume_bonus
+        df['def_rating'] = self.LEAGUE_AVG_DEF_RATING + df['net_rating'] * 0.4
+
+        df['mpg'] = (minutes / games).where(played, 0.0)
+        return df
+
+    def _roster_from_league(self, roster_df: pd.DataFrame) -> pd.DataFrame:
+        """Roster players' season totals sliced out of the league-wide frame"""
+        league_df = self._get_league_df()
+        roster = roster_df[['PLAYER_ID', 'PLAYER']].copy()
+        roster['POSITION'] = roster_df['POSITION'] if 'POSITION' in roster_df else 'F'
+        return league_df.drop(columns=['PLAYER', 'POSITION'], errors='ignore').merge(roster, on='PLAYER_ID')
+
+    def _roster_from_career_stats(self, roster_df: pd.DataFrame) -> pd.DataFrame:
+        """Fallback: one PlayerCareerStats request per roster player"""
+        # Fetch career stats concurrently; the token bucket in
+        # _get_career_df keeps the overall request rate within NBA limits
+        season_rows = []
+        with _output_pool(self.MAX_CAREER_WORKERS) as pool:
+            futures = [
+                (player_row, pool.submit(self._safe_get_career, player_row.PLAYER_ID))
+                for player_row in roster_df.itertuples(index=False)
+            ]
+
+            # Collect in roster order so output stays deterministic
+            for player_row, future in futures:
+                career_df, error = future.result()
+                if error is not None:
+                    print(f"      ⚠ Skipped {player_row.PLAYER}: {error}")
+                    _skip_step_memo()
+                    continue
+
+                if career_df is None or career_df.empty:
+                    continue
+
+                # Get 2025-26 season stats (players without any are skipped) -
+                # index lookup on SEASON_ID instead of a full-column compare
+                career_df = career_df.set_index('SEASON_ID')
+                if self.SEASON not in career_df.index:
+                    continue
+
+                season_stats = career_df.loc[[self.SEASON]].head(1).reset_index().assign(
+                    PLAYER=player_row.PLAYER,
+                    POSITION=getattr(player_row, 'POSITION', 'F')  # Default to F if missing
+                )
+                season_rows.append(season_stats)
+
+        return pd.concat(season_rows, ignore_index=True) if season_rows else pd.DataFrame()
+
+    @_memoize_team_step
+    def step_3_get_player_impacts(self, team_name: str, team_id: Optional[int] = None) -> List[Dict]:
         """
         STEP 3: Run player stats module → base impacts
 
         Args:
             team_name: Full NBA team name
+            team_id: NBA team ID (resolved from team_name if omitted)
 
         Returns:
             List of player impact reports
         """
         print(f"  [STEP 3] Processing player impacts for {team_name}...")
 
-        team_id = self.get_team_id(team_name)
+        if team_id is None:
+            team_id = self.get_team_id(team_name)
         player_impacts = []
 
         try:
@@ -238,124 +796,74 @@ class MasterProjectionEngine:
 
             print(f"    → Roster fetched: {len(roster_df)} players")
 
-            # Process ALL players - let the 4-filter system identify key players
-            top_players = roster_df  # Process entire roster
-
-            print(f"    → Processing all {len(top_players)} players...")
-
-            # Process each player
-            for idx, player_row in top_players.iterrows():
-                player_id = player_row['PLAYER_ID']
-                player_name = player_row['PLAYER']
-                position = player_row.get('POSITION', 'F')  # Default to F if missing
-
-                # Rate limiting
-                if idx > 0:
-                    time.sleep(0.6)  # 600ms between requests
-
-                try:
-                    # Fetch player career stats
-                    career_stats = playercareerstats.PlayerCareerStats(player_id=player_id)
-                    career_df = career_stats.get_data_frames()[0]
-
-                    # Get 2025-26 season stats
-                    season_stats = career_df[career_df['SEASON_ID'] == self.SEASON]
-
-                    if len(season_stats) == 0:
-                        continue
-
-                    stats = season_stats.iloc[0]
-
-                    # Extract required stats for processing
-                    games_played = stats['GP']
-                    total_minutes = stats['MIN']
-                    minutes_per_game = total_minutes / games_played if games_played > 0 else 0
-
-                    # Usage rate approximation from box score stats
-                    fga = stats.get('FGA', 0)
-                    fta = stats.get('FTA', 0)
-                    tov = stats.get('TOV', 0)
-                    # Usage% ≈ (FGA + 0.44*FTA + TOV) / (Team Minutes / 5)
-                    # Simplified: (FGA + 0.44*FTA + TOV) / Minutes * 48
-                    usage_rate = ((fga + 0.44 * fta + tov) / total_minutes * 48) if total_minutes > 0 else 0
-
-                    # Net rating approximation from +/-
-                    # Career stats don't have PLUS_MINUS, so we'll estimate from points/efficiency
-                    pts = stats.get('PTS', 0)
-                    ppg = pts / games_played if games_played > 0 else 0
-                    # Rough net rating estimate: scale PPG to approximate impact
-                    net_rating = (ppg - 15) / 3  # Simplified: avg scorer (15ppg) = 0, elite (30ppg) = +5
-
-                    # For last 10 games usage, use season for now
-                    usage_rate_last_10 = usage_rate
-
-                    # Estimate ON-COURT impact from basic stats (not raw ratings)
-                    # These should be small differentials (±3 to ±8 range), not full ratings
-                    fg_pct = stats.get('FG_PCT', 0.45)
-                    ppg = stats.get('PTS', 15.0) / games_played if games_played > 0 else 15.0
-
-                    # Offensive impact: based on scoring efficiency and volume
-                    # Good scorers: +2 to +5, Poor scorers: -2 to -5
-                    scoring_efficiency = (fg_pct - 0.45) * 10  # FG% above/below average
-                    volume_bonus = min((ppg - 15) / 5, 3)  # Bonus for high scoring (capped at +3)
-                    off_impact = scoring_efficiency + volume_bonus
-
-                    # Defensive impact: use approximation from net rating
-                    # Split net rating 60/40 between offense and defense
-                    def_impact = net_rating * 0.4
-
-                    # Convert to "on-court rating" format (league avg + impact)
-                    off_rating = self.LEAGUE_AVG_OFF_RATING + off_impact
-                    def_rating = self.LEAGUE_AVG_DEF_RATING + def_impact
-
-                    # Calculate minutes per game
-                    mpg = total_minutes / games_played if games_played > 0 else 0
-
-                    # Build player stats dict - MUST match keys expected by player_stats_processor
-                    player_stat_dict = {
-                        'player_name': player_name,
-                        'minutes_played_season': total_minutes,
-                        'minutes_per_game': mpg,
-                        'games_played': games_played,
-                        'usage_rate': usage_rate,  # PRIMARY KEY - required by player_stats_processor
-                        'usage_rate_season': usage_rate,
-                        'usage_rate_last_10': usage_rate_last_10,
-                        'net_rating': net_rating,
-                        'off_rating_oncourt': off_rating,  # MUST be '_oncourt' suffix
-                        'def_rating_oncourt': def_rating   # MUST be '_oncourt' suffix
-                    }
-
-                    # Process through player stats processor
-                    # Default Vegas module values (can be enhanced later)
-                    result = self.player_processor.process_player(
-                        player_stats=player_stat_dict,
-                        team_name=team_name,
-                        position=position,
-                        starter_overlap_pct=100.0,  # Default assumption
-                        is_rim_protector=(position == 'C'),
-                        is_poa_defender=(position == 'G')
-                    )
-
-                    player_impacts.append(result)
-
-                    # DEBUG: Show filter results for top 3 players
-                    if len(player_impacts) <= 3:
-                        print(f"      [{player_name}] Eligible: {result['eligible']}, Tier: {result['tier']}")
-                        if not result['eligible']:
-                            filters = result.get('filter_results', {})
-                            print(f"        Filter A (>300min): {filters.get('min_minutes', '?')}, Filter B (usage stable): {filters.get('usage_stable', '?')}, Filter C (|net|>1.5): {filters.get('strong_onoff', '?')}, Filter D (T1/T2): {filters.get('tier_eligible', '?')}")
-                            print(f"        Stats: Usage={usage_rate:.1f}%, MPG={mpg:.1f}, Net={net_rating:+.2f}, Min={total_minutes:.0f}, Games={games_played}")
+            try:
+                # Primary: one league-wide request, filtered to this roster
+                season_df = self._roster_from_league(roster_df)
+            except Exception as e:
+                print(f"    ⚠ League player stats unavailable ({str(e)[:60]}), fetching per player...")
+                season_df = self._roster_from_career_stats(roster_df)
+
+            # Players under the Filter A minutes floor can never be eligible,
+            # so only the rest go through the 4-filter system (this also
+            # rules out zero-minute / zero-game rows before any division)
+            if not season_df.empty:
+                season_df = season_df[season_df['MIN'] >= self.player_processor.MIN_MINUTES_THRESHOLD].copy()
+
+            print(f"    → Processing {len(season_df)} players with "
+                  f"{self.player_processor.MIN_MINUTES_THRESHOLD}+ minutes...")
+
+            if season_df.empty:
+                print(f"    ✓ Player impacts calculated: 0 total, 0 eligible")
+                return player_impacts
+
+            # All arithmetic in one vectorized pass over the roster
+            stats_df = self._compute_player_metrics(season_df)
+
+            for row in stats_df.itertuples(index=False):
+                player_name = row.PLAYER
+                position = row.POSITION
+
+                # Build player stats dict - MUST match keys expected by player_stats_processor
+                player_stat_dict = {
+                    'player_name': player_name,
+                    'minutes_played_season': row.MIN,
+                    'minutes_per_game': row.mpg,
+                    'games_played': row.GP,
+                    'usage_rate': row.usage_rate,  # PRIMARY KEY - required by player_stats_processor
+                    'usage_rate_season': row.usage_rate,
+                    'usage_rate_last_10': row.usage_rate,  # season for now
+                    'net_rating': row.net_rating,
+                    'off_rating_oncourt': row.off_rating,  # MUST be '_oncourt' suffix
+                    'def_rating_oncourt': row.def_rating   # MUST be '_oncourt' suffix
+                }
 
-                except Exception as e:
-                    # Skip players that fail (probably didn't play enough)
-                    print(f"      ⚠ Skipped {player_name}: {str(e)[:60]}")
-                    continue
+                # Process through player stats processor
+                # Default Vegas module values (can be enhanced later)
+                result = self.player_processor.process_player(
+                    player_stats=player_stat_dict,
+                    team_name=team_name,
+                    position=position,
+                    starter_overlap_pct=100.0,  # Default assumption
+                    is_rim_protector=(position == 'C'),
+                    is_poa_defender=(position == 'G')
+                )
+
+                player_impacts.append(result)
+
+                # DEBUG: Show filter results for top 3 players
+                if len(player_impacts) <= 3:
+                    print(f"      [{player_name}] Eligible: {result['eligible']}, Tier: {result['tier']}")
+                    if not result['eligible']:
+                        filters = result.get('filter_results', {})
+                        print(f"        Filter A (>300min): {filters.get('min_minutes', '?')}, Filter B (usage stable): {filters.get('usage_stable', '?')}, Filter C (|net|>1.5): {filters.get('strong_onoff', '?')}, Filter D (T1/T2): {filters.get('tier_eligible', '?')}")
+                        print(f"        Stats: Usage={row.usage_rate:.1f}%, MPG={row.mpg:.1f}, Net={row.net_rating:+.2f}, Min={row.MIN:.0f}, Games={row.GP}")
 
             eligible_count = sum(1 for p in player_impacts if p['eligible'])
             print(f"    ✓ Player impacts calculated: {len(player_impacts)} total, {eligible_count} eligible")
 
         except Exception as e:
             print(f"    ❌ Error fetching roster: {e}")
+            _skip_step_memo()
             player_impacts = []
 
         return player_impacts
@@ -417,17 +925,24 @@ class MasterProjectionEngine:
         def_adjustment = 0.0
         impact_breakdown = []
 
-        # Create lookup dictionary for player impacts
-        impact_lookup = {p['player_name']: p for p in player_impacts}
+        # Create lookup dictionary for player impacts - ESPN and nba_api
+        # spell names differently ("P.J." vs "PJ", accents), so key on _canon
+        impact_lookup = {_canon(p['player_name']): p for p in player_impacts}
 
         # Process each injured player
         for injury in injury_report['injury_report']:
             player_name = injury['player_name']
             model_status = injury['model_status']
 
+            canon_name = _canon(player_name)
+            player_data = impact_lookup.get(canon_name)
+            if player_data is None and fuzz_process is not None and impact_lookup:
+                match = fuzz_process.extractOne(canon_name, impact_lookup.keys(), score_cutoff=NAME_MATCH_CUTOFF)
+                if match is not None:
+                    player_data = impact_lookup[match[0]]
+
             # Check if we have impact data for this player
-            if player_name in impact_lookup:
-                player_data = impact_lookup[player_name]
+            if player_data is not None:
                 eligible = player_data['eligible']
 
                 # KEY LOGIC: If eligible AND unavailable, flip and apply impact
@@ -509,38 +1024,29 @@ class MasterProjectionEngine:
         """
         print(f"  [STEP 7] Projecting game...")
 
-        # Calculate average pace
-        avg_pace = (home_adjusted['pace_final'] + away_adjusted['pace_final']) / 2
-
-        # Project possessions (simplified - actual model uses more complex formula)
-        possessions = avg_pace
-
-        # Project points (with home court adjustment)
-        home_points = (home_adjusted['off_rating_final'] + away_adjusted['def_rating_final']) / 2
-        home_points = (home_points / 100) * possessions + self.HOME_COURT_ADJ
-
-        away_points = (away_adjusted['off_rating_final'] + home_adjusted['def_rating_final']) / 2
-        away_points = (away_points / 100) * possessions
+        # Pace -> possessions and points (with home court adjustment) in
+        # the compiled kernel; see _project_core
+        home_points, away_points, possessions = _project_core(
+            float(home_adjusted['off_rating_final']), float(home_adjusted['def_rating_final']),
+            float(away_adjusted['off_rating_final']), float(away_adjusted['def_rating_final']),
+            float(home_adjusted['pace_final']), float(away_adjusted['pace_final']),
+            float(self.HOME_COURT_ADJ)
+        )
 
         # Calculate total
         total = round(home_points + away_points, 1)
 
-        # Determine favorite (team with higher projected score)
+        # Determine favorite (team with higher projected score) in one comparison
         # Favorite gets negative spread, underdog gets positive spread
-        point_differential = abs(home_points - away_points)
-
-        if home_points > away_points:
-            # Home team is favorite
-            favorite_team = home_adjusted['team_name']
-            favorite_spread = -round(point_differential, 1)
-            underdog_team = away_adjusted['team_name']
-            underdog_spread = round(point_differential, 1)
+        point_differential = home_points - away_points
+        spread = round(abs(point_differential), 1)
+        home_is_favorite = point_differential > 0
+
+        if home_is_favorite:
+            favorite_team, underdog_team = home_adjusted['team_name'], away_adjusted['team_name']
         else:
-            # Away team is favorite
-            favorite_team = away_adjusted['team_name']
-            favorite_spread = -round(point_differential, 1)
-            underdog_team = home_adjusted['team_name']
-            underdog_spread = round(point_differential, 1)
+            favorite_team, underdog_team = away_adjusted['team_name'], home_adjusted['team_name']
+        favorite_spread, underdog_spread = -spread, spread
 
         projection = {
             'home_team': home_adjusted['team_name'],
@@ -556,12 +1062,8 @@ class MasterProjectionEngine:
         }
 
         # Display spread for BOTH teams (home and away)
-        if home_points > away_points:
-            home_spread = favorite_spread  # Negative (home is favorite)
-            away_spread = underdog_spread  # Positive (away is underdog)
-        else:
-            home_spread = underdog_spread  # Positive (home is underdog)
-            away_spread = favorite_spread  # Negative (away is favorite)
+        home_spread = favorite_spread if home_is_favorite else underdog_spread
+        away_spread = underdog_spread if home_is_favorite else favorite_spread
 
         print(f"    ✓ Spread: {home_adjusted['team_name']} {home_spread:+.1f} / {away_adjusted['team_name']} {away_spread:+.1f}")
         print(f"    ✓ Total: {projection['total']}")
@@ -571,7 +1073,9 @@ class MasterProjectionEngine:
 
     def step_8_apply_rest_adjustment(self, projection: Dict, home_team: str,
                                      away_team: str, game_date: datetime,
-                                     rest_adjustment: bool = True) -> Dict:
+                                     rest_adjustment: bool = True,
+                                     home_team_id: Optional[int] = None,
+                                     away_team_id: Optional[int] = None) -> Dict:
         """
         STEP 8: Apply rest adjustment to baseline spread (OPTIONAL MODULE)
 
@@ -584,6 +1088,8 @@ class MasterProjectionEngine:
             away_team: Away team name
             game_date: Date of current game
             rest_adjustment: Toggle to enable/disable rest adjustment
+            home_team_id: Home team ID (resolved from home_team if omitted)
+            away_team_id: Away team ID (resolved from away_team if omitted)
 
         Returns:
             Dict with rest adjustment details and final spread
@@ -603,8 +1109,10 @@ class MasterProjectionEngine:
         print(f"  [STEP 8] Applying rest adjustment...")
 
         # Get team IDs
-        home_team_id = self.get_team_id(home_team)
-        away_team_id = self.get_team_id(away_team)
+        if home_team_id is None:
+            home_team_id = self.get_team_id(home_team)
+        if away_team_id is None:
+            away_team_id = self.get_team_id(away_team)
 
         # Calculate baseline spread (home perspective: negative = home favored)
         home_points = projection['home_points']
@@ -682,10 +1190,33 @@ class MasterProjectionEngine:
 
         return pace_result
 
+    def _process_team(self, team_name: str, team_id: int, injury_adjustment: bool = True):
+        """
+        Run steps 1-6 for one team (worker thread in run_full_pipeline)
+
+        Args:
+            team_name: Full NBA team name
+            team_id: NBA team ID
+            injury_adjustment: Enable injury impact processing
+
+        Returns:
+            ((adjusted ratings, injury adjustments), captured step output)
+        """
+        # On failure _buffered_output prints the step output before re-raising
+        with _buffered_output() as log:
+            baseline = self.step_1_load_baseline_stats(team_name, team_id)
+            injuries = self.step_2_get_injury_report(team_name, injury_adjustment)
+            player_impacts = self.step_3_get_player_impacts(team_name, team_id)
+            player_impacts = self.step_4_apply_vegas_modules(player_impacts)
+            adjustments = self.step_5_merge_injuries_and_impacts(injuries, player_impacts, injury_adjustment)
+            adjusted = self.step_6_adjust_team_ratings(baseline, adjustments)
+
+        return (adjusted, adjustments), log.getvalue()
+
     def run_full_pipeline(self, home_team: str, away_team: str,
                           injury_adjustment: bool = True,
                           rest_adjustment: bool = True,
-                          pace_adjustment: bool = True) -> Dict:
+                          pace_adjustment: bool = True) -> PipelineResult:
         """
         Execute complete pipeline for a matchup (7 steps baseline + optional modules)
 
@@ -697,31 +1228,67 @@ class MasterProjectionEngine:
             pace_adjustment: Enable pace adjustment module (default: True)
 
         Returns:
-            Complete projection with baseline and adjusted values
+            PipelineResult with baseline and adjusted values
         """
-        print(f"\n{'='*80}")
+        print(f"\n{_BANNER}")
         print(f"MASTER PROJECTION PIPELINE")
         print(f"Matchup: {away_team} @ {home_team}")
-        print(f"{'='*80}\n")
+        print(f"{_BANNER}\n")
+
+        # Resolve team IDs once for every step that needs them
+        home_team_id = self.get_team_id(home_team)
+        away_team_id = self.get_team_id(away_team)
+
+        # Home and away are independent - run both branches at once and
+        # print each team's log in order once they finish
+        _install_output_proxy()
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            home_future = pool.submit(self._process_team, home_team, home_team_id, injury_adjustment)
+            away_future = pool.submit(self._process_team, away_team, away_team_id, injury_adjustment)
+            home_state = home_future.result()
+            away_state = away_future.result()
+
+        return self._finalize_matchup(
+            home_team, away_team,
+            home_state=home_state,
+            away_state=away_state,
+            home_team_id=home_team_id,
+            away_team_id=away_team_id,
+            rest_adjustment=rest_adjustment,
+            pace_adjustment=pace_adjustment
+        )
+
+    def _finalize_matchup(self, home_team: str, away_team: str,
+                          home_state: Tuple, away_state: Tuple,
+                          home_team_id: int, away_team_id: int,
+                          rest_adjustment: bool = True,
+                          pace_adjustment: bool = True) -> PipelineResult:
+        """
+        Print both teams' step 1-6 output, then run steps 7-9 for the matchup
+
+        Args:
+            home_team: Home team name
+            away_team: Away team name
+            home_state: _process_team result for the home team
+            away_state: _process_team result for the away team
+            home_team_id: Home team ID
+            away_team_id: Away team ID
+            rest_adjustment: Enable rest adjustment module
+            pace_adjustment: Enable pace adjustment module
+
+        Returns:
+            PipelineResult with baseline and adjusted values
+        """
+        (home_adjusted, home_adjustments), home_log = home_state
+        (away_adjusted, away_adjustments), away_log = away_state
 
-        # Process home team
         print(f"📊 PROCESSING HOME TEAM: {home_team}")
         print("-" * 80)
-        home_baseline = self.step_1_load_baseline_stats(home_team)
-        home_injuries = self.step_2_get_injury_report(home_team, injury_adjustment)
-        home_player_impacts = self.step_3_get_player_impacts(home_team)
-        home_player_impacts = self.step_4_apply_vegas_modules(home_player_impacts)
-        home_adjustments = self.step_5_merge_injuries_and_impacts(home_injuries, home_player_impacts, injury_adjustment)
-        home_adjusted = self.step_6_adjust_team_ratings(home_baseline, home_adjustments)
+        print(home_log, end='')
 
         print(f"\n📊 PROCESSING AWAY TEAM: {away_team}")
         print("-" * 80)
-        away_baseline = self.step_1_load_baseline_stats(away_team)
-        away_injuries = self.step_2_get_injury_report(away_team, injury_adjustment)
-        away_player_impacts = self.step_3_get_player_impacts(away_team)
-        away_player_impacts = self.step_4_apply_vegas_modules(away_player_impacts)
-        away_adjustments = self.step_5_merge_injuries_and_impacts(away_injuries, away_player_impacts, injury_adjustment)
-        away_adjusted = self.step_6_adjust_team_ratings(away_baseline, away_adjustments)
+        print(away_log, end='')
 
         # Project game
         print(f"\n🎯 FINAL PROJECTION")
@@ -733,8 +1300,10 @@ class MasterProjectionEngine:
             projection=projection,
             home_team=home_team,
             away_team=away_team,
-            game_date=datetime.now(),
-            rest_adjustment=rest_adjustment
+            game_date=self._run_timestamp or datetime.now(),
+            rest_adjustment=rest_adjustment,
+            home_team_id=home_team_id,
+            away_team_id=away_team_id
         )
 
         # Apply pace adjustment (optional module)
@@ -745,15 +1314,143 @@ class MasterProjectionEngine:
             pace_adjustment=pace_adjustment
         )
 
-        return {
-            'home_adjusted': home_adjusted,
-            'away_adjusted': away_adjusted,
-            'projection': projection,
-            'rest_adjustment': rest_result,
-            'pace_adjustment': pace_result,
-            'home_injury_breakdown': home_adjustments['impact_breakdown'],
-            'away_injury_breakdown': away_adjustments['impact_breakdown']
-        }
+        return PipelineResult(
+            home_adjusted=home_adjusted,
+            away_adjusted=away_adjusted,
+            projection=projection,
+            rest_adjustment=rest_result,
+            pace_adjustment=pace_result,
+            home_injury_breakdown=home_adjustments['impact_breakdown'],
+            away_injury_breakdown=away_adjustments['impact_breakdown']
+        )
+
+    def run_slate(self, matchups: List[Tuple[str, str]],
+                  injury_adjustment: bool = True,
+                  rest_adjustment: bool = True,
+                  pace_adjustment: bool = True,
+                  game_date: Optional[datetime] = None) -> List[PipelineResult]:
+        """
+        Project a whole slate with shared warm state: one API warm-up, one
+        league-wide player stats pull, one injury pass, and steps 1-6 run
+        once per distinct team (concurrently) before each game is finalized
+
+        Args:
+            matchups: List of (away_team, home_team) tuples, as returned by
+                get_todays_games()
+            injury_adjustment: Enable injury impact processing (default: True)
+            rest_adjustment: Enable rest adjustment module (default: True)
+            pace_adjustment: Enable pace adjustment module (default: True)
+            game_date: Date the slate is projected for (default: now)
+
+        Returns:
+            Projections for every matchup that completed
+        """
+        self._run_timestamp = game_date or datetime.now()
+        warm_up_api()
+
+        # An unknown team only costs its own games, not the slate
+        teams_needed = []
+        team_ids = {}
+        for team in dict.fromkeys(team for matchup in matchups for team in matchup):
+            try:
+                team_ids[team] = self.get_team_id(team)
+                teams_needed.append(team)
+            except Exception as e:
+                print(f"❌ Error processing {team}: {e}")
+
+        # Fixed-cost fetches shared by every game in the slate (a league
+        # pull that failed on an earlier slate gets one fresh attempt)
+        with self._league_lock:
+            self._league_error = None
+        try:
+            self._get_league_df()
+        except Exception as e:
+            print(f"⚠ League player stats unavailable, step 3 will fetch per player: {e}")
+        if injury_adjustment:
+            self._get_all_injuries(teams_needed)
+
+        _install_output_proxy()
+        team_states = {}
+        with ThreadPoolExecutor(max_workers=min(self.MAX_SLATE_TEAM_WORKERS, len(teams_needed) or 1)) as pool:
+            futures = {
+                team: pool.submit(self._process_team, team, team_ids[team], injury_adjustment)
+                for team in teams_needed
+            }
+            for team, future in futures.items():
+                try:
+                    team_states[team] = future.result()
+                except Exception as e:
+                    print(f"❌ Error processing {team}: {e}")
+
+        all_projections = []
+
+        for i, (away_team, home_team) in enumerate(matchups, 1):
+            print(f"\n{_BANNER}")
+            print(f"GAME {i}/{len(matchups)}: {away_team} @ {home_team}")
+            print(f"{_BANNER}\n")
+
+            if home_team not in team_states or away_team not in team_states:
+                print(f"❌ Skipping {away_team} @ {home_team}: team processing failed")
+                continue
+
+            try:
+                result = self._finalize_matchup(
+                    home_team, away_team,
+                    home_state=team_states[home_team],
+                    away_state=team_states[away_team],
+                    home_team_id=team_ids[home_team],
+                    away_team_id=team_ids[away_team],
+                    rest_adjustment=rest_adjustment,
+                    pace_adjustment=pace_adjustment
+                )
+                all_projections.append(result)
+            except Exception as e:
+                print(f"❌ Error processing {away_team} @ {home_team}: {e}")
+                continue
+
+        return all_projections
+
+    def _fetch_scoreboard(self, url: str) -> Dict:
+        """
+        ESPN scoreboard JSON, reusing today's disk-cached copy when it is
+        fresh (SCOREBOARD_FRESH_SECONDS) or ESPN answers 304 Not Modified
+
+        Args:
+            url: Scoreboard URL
+
+        Returns:
+            Parsed scoreboard payload
+        """
+        key = ('scoreboard', url, date.today().isoformat())
+        cached = _disk_cache.get(key)
+
+        if cached is not None and time.time() - cached['fetched_at'] < self.SCOREBOARD_FRESH_SECONDS:
+            return cached['data']
+
+        headers = {'If-None-Match': cached['etag']} if cached and cached.get('etag') else None
+        # stream=True holds the pooled connection until the response is closed
+        with self.session.get(url, headers=headers, timeout=self.ESPN_TIMEOUT,
+                              stream=True) as response:
+            if response.status_code == 304 and cached is not None:
+                data = cached['data']
+            else:
+                response.raise_for_status()
+                size = int(response.headers.get('Content-Length') or 0)
+                if ijson is not None and size > self.SCOREBOARD_STREAM_BYTES:
+                    # Very large payloads (playoffs): stream just the events
+                    # instead of materializing the whole tree
+                    response.raw.decode_content = True
+                    data = {'events': list(ijson.items(response.raw, 'events.item', use_float=True))}
+                else:
+                    data = orjson.loads(response.content)
+            etag = response.headers.get('ETag')
+
+        _disk_cache.set(key, {
+            'data': data,
+            'etag': etag or (cached or {}).get('etag'),
+            'fetched_at': time.time()
+        }, expire=CACHE_EXPIRE)
+        return data
 
     def get_todays_games(self) -> List[Tuple[str, str]]:
         """
@@ -768,10 +1465,7 @@ class MasterProjectionEngine:
         try:
             # Fetch from ESPN's public scoreboard API
             url = "https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard"
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-
-            data = response.json()
+            data = self._fetch_scoreboard(url)
             events = data.get('events', [])
 
             if len(events) == 0:
@@ -779,6 +1473,7 @@ class MasterProjectionEngine:
                 return []
 
             matchups = []
+            to_full = _ESPN_ABBR_TO_FULL.get
 
             for event in events:
                 competitions = event.get('competitions', [])
@@ -791,23 +1486,29 @@ class MasterProjectionEngine:
                 if len(competitors) < 2:
                     continue
 
-                # ESPN format: competitors[0] is home, competitors[1] is away
-                home_competitor = competitors[0] if competitors[0].get('homeAway') == 'home' else competitors[1]
-                away_competitor = competitors[1] if competitors[0].get('homeAway') == 'home' else competitors[0]
+                # Pick sides by ESPN's homeAway field; fall back to the usual
+                # order (competitors[0] is home) if a role is missing
+                by_role = {c.get('homeAway'): c for c in competitors}
+                home_competitor = by_role.get('home') or competitors[0]
+                away_competitor = by_role.get('away') or competitors[1]
 
                 home_abbr = home_competitor.get('team', {}).get('abbreviation', '')
                 away_abbr = away_competitor.get('team', {}).get('abbreviation', '')
 
-                # Convert abbreviations to full team names
-                home_team = self._espn_abbr_to_full_name(home_abbr)
-                away_team = self._espn_abbr_to_full_name(away_abbr)
+                # Convert abbreviations to full team names (precomputed map,
+                # inlined here - see _espn_abbr_to_full_name)
+                home_team = to_full(home_abbr, home_abbr)
+                away_team = to_full(away_abbr, away_abbr)
 
                 matchups.append((away_team, home_team))
 
             print(f"✓ Found {len(matchups)} games today\n")
             return matchups
 
-        except requests.RequestException as e:
+        # orjson's (and, for streamed scoreboards, ijson's) decode error
+        # stands in for the requests JSONDecodeError that response.json()
+        # used to raise here
+        except (requests.RequestException, orjson.JSONDecodeError, *_IJSON_ERRORS) as e:
             raise Exception(f"Failed to fetch schedule from ESPN API: {e}")
         except Exception as e:
             print(f"Error parsing schedule: {e}")
@@ -819,27 +1520,45 @@ class MasterProjectionEngine:
         """
         Convert ESPN team abbreviation to full team name
         Handles differences between ESPN and nba_api abbreviations
+        (falls back to the original abbreviation if not found)
+
+        The module-level _ESPN_ABBR_TO_FULL precompute makes this a single
+        dict hit, so it is not memoized; hot loops bind the dict's .get directly.
         """
-        # ESPN -> nba_api abbreviation mapping for mismatches
-        espn_to_nba = {
-            'WSH': 'WAS',  # Washington
-            'UTAH': 'UTA',  # Utah
-            'GS': 'GSW',    # Golden State
-            'SA': 'SAS',    # San Antonio
-            'NY': 'NYK',    # New York
-            'NO': 'NOP'     # New Orleans
-        }
+        return _ESPN_ABBR_TO_FULL.get(abbr, abbr)
 
-        # Convert ESPN abbreviation if needed
-        nba_abbr = espn_to_nba.get(abbr, abbr)
+    @staticmethod
+    def _capture(func, *args, **kwargs):
+        """
+        Call func on a worker thread with its output buffered
 
-        # Find team by nba_api abbreviation
-        for team in self.all_teams:
-            if team['abbreviation'] == nba_abbr:
-                return team['full_name']
+        Returns:
+            (func result, captured output); exceptions are re-raised after
+            the captured output is printed
+        """
+        with _buffered_output() as log:
+            result = func(*args, **kwargs)
+        return result, log.getvalue()
+
+    def _evaluate_yesterday(self) -> str:
+        """
+        Score yesterday's predictions (worker thread in project_all_games)
 
-        # Fallback: return original abbreviation if not found
-        return abbr
+        Returns:
+            Captured output of the evaluation
+        """
+        with _buffered_output() as log:
+            print(f"\n{_BANNER}")
+            print(f"EVALUATING YESTERDAY'S PREDICTIONS")
+            print(f"{_BANNER}")
+            try:
+                fetcher = OutcomeFetcher(session=self.session)
+                fetcher.update_performance_log()
+            except Exception as e:
+                print(f"⚠ Could not evaluate yesterday's predictions: {e}")
+                print("Continuing with today's projections...\n")
+
+        return log.getvalue()
 
     def project_all_games(self):
         """
@@ -849,168 +1568,205 @@ class MasterProjectionEngine:
 
         Also evaluates yesterday's predictions and saves today's predictions
         """
-        print(f"\n{'='*80}")
-        print(f"NBA MASTER PROJECTION ENGINE - {datetime.now().strftime('%B %d, %Y')}")
-        print(f"{'='*80}\n")
+        # One timestamp for the whole run so every game shares the same date
+        self._run_timestamp = datetime.now()
+        self._date_str = self._run_timestamp.strftime('%B %d, %Y')
+
+        print(f"\n{_BANNER}")
+        print(f"NBA MASTER PROJECTION ENGINE - {self._date_str}")
+        print(f"{_BANNER}\n")
 
         # STEP 0: Evaluate yesterday's predictions (if performance tracking enabled)
-        if PERFORMANCE_TRACKING_ENABLED:
-            print(f"\n{'='*80}")
-            print(f"EVALUATING YESTERDAY'S PREDICTIONS")
-            print(f"{'='*80}")
-            try:
-                fetcher = OutcomeFetcher()
-                fetcher.update_performance_log()
-            except Exception as e:
-                print(f"⚠ Could not evaluate yesterday's predictions: {e}")
-                print("Continuing with today's projections...\n")
+        # while today's schedule is fetched - the two calls are independent
+        _install_output_proxy()
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            outcome_future = pool.submit(self._evaluate_yesterday) if PERFORMANCE_TRACKING_ENABLED else None
+            schedule_future = pool.submit(self._capture, self.get_todays_games)
+
+            if outcome_future is not None:
+                print(outcome_future.result(), end='')
 
-        matchups = self.get_todays_games()
+            matchups, schedule_log = schedule_future.result()
+            print(schedule_log, end='')
 
         if not matchups:
             print("No games scheduled today.")
             return
 
-        all_projections = []
+        # Each distinct team runs steps 1-6 once, concurrently, then every
+        # game is finalized in slate order
+        all_projections = self.run_slate(matchups, game_date=self._run_timestamp)
 
-        for i, (away_team, home_team) in enumerate(matchups, 1):
-            print(f"\n{'='*80}")
-            print(f"GAME {i}/{len(matchups)}")
-            print(f"{'='*80}")
-
-            try:
-                result = self.run_full_pipeline(home_team, away_team)
-                all_projections.append(result)
-            except Exception as e:
-                print(f"❌ Error processing {away_team} @ {home_team}: {e}")
-                continue
+        # Injury totals are computed once and shared by the summary and the save
+        totals = self._injury_adjustment_totals(all_projections)
 
         # Print summary
-        self.print_summary(all_projections)
+        self.print_summary(all_projections, totals)
 
         # FINAL STEP: Save today's predictions for tomorrow's evaluation
         if PERFORMANCE_TRACKING_ENABLED and all_projections:
-            print(f"\n{'='*80}")
+            print(f"\n{_BANNER}")
             print(f"SAVING TODAY'S PREDICTIONS")
-            print(f"{'='*80}\n")
+            print(f"{_BANNER}\n")
             try:
-                self.save_predictions_for_tracking(all_projections)
+                self.save_predictions_for_tracking(all_projections, totals)
             except Exception as e:
                 print(f"⚠ Could not save predictions: {e}")
 
-    def save_predictions_for_tracking(self, all_projections: List[Dict]):
+    @staticmethod
+    def _injury_adjustment_totals(projections: List[PipelineResult]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Total (off + def) injury adjustment per game for home and away
+
+        Returns:
+            (home totals, away totals) arrays aligned with projections
+        """
+        adj = np.array([
+            (r.home_adjusted['off_adjustment'], r.home_adjusted['def_adjustment'],
+             r.away_adjusted['off_adjustment'], r.away_adjusted['def_adjustment'])
+            for r in projections
+        ], dtype=float).reshape(-1, 4)
+        home_adj = adj[:, 0] + adj[:, 1]
+        away_adj = adj[:, 2] + adj[:, 3]
+        return home_adj, away_adj
+
+    def save_predictions_for_tracking(self, all_projections: List[PipelineResult],
+                                      totals: Optional[Tuple[np.ndarray, np.ndarray]] = None):
         """
         Save today's predictions for tomorrow's performance evaluation
 
         Args:
-            all_projections: List of projection result dicts
-        """
-        today = datetime.now().strftime('%Y-%m-%d')
-
-        # Format predictions for saving
-        games_to_save = []
-
-        for result in all_projections:
-            proj = result['projection']
-            home_adj = result['home_adjusted']
-            away_adj = result['away_adjusted']
-            rest = result.get('rest_adjustment', {})
-            pace = result.get('pace_adjustment', {})
-
-            # Calculate total injury adjustments
-            home_total_adj = home_adj['off_adjustment'] + home_adj['def_adjustment']
-            away_total_adj = away_adj['off_adjustment'] + away_adj['def_adjustment']
-
-            # Get the appropriate spread and total
-            baseline_spread = proj.get('spread', 0)
-            rest_adjusted_spread = rest.get('rest_module_spread', baseline_spread)
-
-            baseline_total = proj.get('total', 0)
-            pace_adjusted_total = pace.get('pace_module_total', baseline_total)
-
-            game_dict = {
-                'home_team': proj['home_team'],
-                'away_team': proj['away_team'],
-                'spread': {
-                    'baseline': baseline_spread,
-                    'rest_adjusted': rest_adjusted_spread
-                },
-                'total': {
-                    'baseline': baseline_total,
-                    'pace_adjusted': pace_adjusted_total
-                },
-                'injury_impact': {
-                    'home_total_adjustment': home_total_adj,
-                    'away_total_adjustment': away_total_adj
-                }
-            }
+            all_projections: List of PipelineResult objects
+            totals: _injury_adjustment_totals(all_projections), if already computed
+        """
+        today = (self._run_timestamp or datetime.now()).strftime('%Y-%m-%d')
+
+        home_totals, away_totals = totals or self._injury_adjustment_totals(all_projections)
+
+        rows = zip(all_projections, home_totals.tolist(), away_totals.tolist())
 
-            games_to_save.append(game_dict)
+        if self.STREAM_PREDICTIONS:
+            # Serialize each game straight to disk, no intermediate list
+            saved = save_predictions_stream(
+                today, (self._format_prediction(*row) for row in rows))
+        else:
+            # Format predictions for saving (list preallocated to slate size)
+            games_to_save = [None] * len(all_projections)
+            for i, row in enumerate(rows):
+                games_to_save[i] = self._format_prediction(*row)
+
+            # Save to JSON
+            save_predictions(today, games_to_save)
+            saved = len(games_to_save)
 
-        # Save to JSON
-        save_predictions(today, games_to_save)
-        print(f"✓ Saved {len(games_to_save)} prediction(s) for future evaluation")
+        print(f"✓ Saved {saved} prediction(s) for future evaluation")
 
-    def print_summary(self, projections: List[Dict]):
+    @staticmethod
+    def _format_prediction(result: PipelineResult, home_total_adj: float,
+                           away_total_adj: float) -> Dict:
+        """
+        Build the saved-prediction dict for one game
+
+        Args:
+            result: PipelineResult for the game
+            home_total_adj: Summed home injury adjustment
+            away_total_adj: Summed away injury adjustment
+
+        Returns:
+            Game dict in the save_predictions schema
+        """
+        proj = result.projection
+
+        # Get the appropriate spread and total
+        baseline_spread = proj.get('spread', 0)
+        baseline_total = proj.get('total', 0)
+
+        return {
+            'home_team': proj['home_team'],
+            'away_team': proj['away_team'],
+            'spread': {
+                'baseline': baseline_spread,
+                'rest_adjusted': result.rest_adjustment.get('rest_module_spread', baseline_spread)
+            },
+            'total': {
+                'baseline': baseline_total,
+                'pace_adjusted': result.pace_adjustment.get('pace_module_total', baseline_total)
+            },
+            'injury_impact': {
+                'home_total_adjustment': home_total_adj,
+                'away_total_adjustment': away_total_adj
+            }
+        }
+
+    def print_summary(self, projections: List[PipelineResult],
+                      totals: Optional[Tuple[np.ndarray, np.ndarray]] = None):
         """
         Print summary of all projections
 
         Args:
             projections: List of projection results
+            totals: _injury_adjustment_totals(projections), if already computed
         """
-        print(f"\n{'='*80}")
-        print(f"PROJECTION SUMMARY - {len(projections)} GAMES")
-        print(f"{'='*80}\n")
+        # Build the whole summary, then emit it in one write
+        lines = []
+        home_totals, away_totals = totals or self._injury_adjustment_totals(projections)
+
+        lines.append(f"\n{_BANNER}")
+        lines.append(f"PROJECTION SUMMARY - {len(projections)} GAMES")
+        lines.append(f"{_BANNER}\n")
 
         for i, result in enumerate(projections, 1):
-            proj = result['projection']
-            home = result['home_adjusted']
-            away = result['away_adjusted']
-            rest = result.get('rest_adjustment', {})
-            pace = result.get('pace_adjustment', {})
+            proj = result.projection
+            home = result.home_adjusted
+            away = result.away_adjusted
+            rest = result.rest_adjustment
+            pace = result.pace_adjustment
 
-            print(f"Game {i}: {proj['away_team']} @ {proj['home_team']}")
-            print(f"  Spread: {proj['favorite_team']} {proj['favorite_spread']:.1f}")
+            lines.append(_SUMMARY_GAME.format(i=i, **proj))
+            lines.append(_SUMMARY_SPREAD.format_map(proj))
 
             # Show rest-adjusted spread if enabled
             if rest.get('rest_adjustment_enabled', False):
                 rest_spread = rest['rest_module_spread']
                 # Determine which team is favored in rest-adjusted spread
                 if rest_spread < 0:
-                    fav_team = proj['home_team']
-                    spread_display = f"{fav_team} {rest_spread:.1f}"
+                    lines.append(_SUMMARY_REST_SPREAD.format(team=proj['home_team'], spread=rest_spread))
                 else:
-                    fav_team = proj['away_team']
-                    spread_display = f"{fav_team} {-rest_spread:.1f}"
-                print(f"  Rest-Adjusted Spread: {spread_display}")
-                print(f"    Rest Days: {proj['home_team']}={rest['rest_days_home']}d, {proj['away_team']}={rest['rest_days_away']}d")
+                    lines.append(_SUMMARY_REST_SPREAD.format(team=proj['away_team'], spread=-rest_spread))
+                lines.append(_SUMMARY_REST_DAYS.format(home=proj['home_team'], away=proj['away_team'], **rest))
 
-            print(f"  Total: {proj['total']}")
+            lines.append(_SUMMARY_TOTAL.format_map(proj))
 
             # Show pace-adjusted total if enabled
             if pace.get('pace_adjustment_enabled', False):
-                pace_total = pace['pace_module_total']
-                pace_delta = pace['pace_delta']
-                print(f"  Pace-Adjusted Total: {pace_total:.1f}")
-                print(f"    Pace Delta: {pace_delta:+.2f} (Adj: {pace['pace_total_adj']:+.1f})")
+                lines.append(_SUMMARY_PACE_TOTAL.format_map(pace))
+                lines.append(_SUMMARY_PACE_DELTA.format_map(pace))
 
-            print(f"  Score: {proj['home_points']}-{proj['away_points']}")
+            lines.append(_SUMMARY_SCORE.format_map(proj))
 
             # Show injury impacts
-            home_adj = home['off_adjustment'] + home['def_adjustment']
-            away_adj = away['off_adjustment'] + away['def_adjustment']
+            home_adj = home_totals[i - 1]
+            away_adj = away_totals[i - 1]
 
             if home_adj != 0 or away_adj != 0:
-                print(f"  Injury Impact:")
+                lines.append(f"  Injury Impact:")
                 if home_adj != 0:
-                    print(f"    {home['team_name']}: {home_adj:+.2f} total adjustment")
+                    lines.append(_SUMMARY_INJURY.format(team=home['team_name'], adj=home_adj))
                 if away_adj != 0:
-                    print(f"    {away['team_name']}: {away_adj:+.2f} total adjustment")
+                    lines.append(_SUMMARY_INJURY.format(team=away['team_name'], adj=away_adj))
 
-            print()
+            lines.append('')
+
+        sys.stdout.write('\n'.join(lines) + '\n')
+        sys.stdout.flush()
 
 
 if __name__ == "__main__":
+    # Outcome fetcher reports through logging; route it to the thread-aware
+    # stdout so its lines land in the captured evaluation block
+    _install_output_proxy()
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+
     # Run master projection engine
     engine = MasterProjectionEngine()
     engine.project_all_games()
@@ -16,17 +16,115 @@ This will:
 5. Log results to performance tracker
 """
 
+import asyncio
+import csv
+import io
+import logging
+import os
+import pickle
+import sys
+import time
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util.retry import Retry
 import json
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, List, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:  # stdlib fallback; json.loads accepts bytes too
+    orjson = json
+
+try:
+    import httpx
+except ImportError:  # odds are fetched one game at a time instead
+    httpx = None
+
+try:
+    import ijson
+    _IJSON_ERRORS = (ijson.JSONError,)
+except ImportError:  # large scoreboards are parsed in one shot instead
+    ijson = None
+    _IJSON_ERRORS = ()
+
+logger = logging.getLogger(__name__)
+
+_BANNER = "=" * 80
+
 # Import logger - handle both direct execution and module import
 try:
-    from .performance_logger import log_model_performance
+    from .performance_logger import log_model_performance_bulk
 except ImportError:
-    from performance_logger import log_model_performance
+    from performance_logger import log_model_performance_bulk
+
+
+# Team abbreviation mapping (ESPN full name → abbreviation); read-only so
+# the cached lookup below can never go stale
+TEAM_ABBREV_MAP = MappingProxyType({
+    'Atlanta Hawks': 'ATL',
+    'Boston Celtics': 'BOS',
+    'Brooklyn Nets': 'BKN',
+    'Charlotte Hornets': 'CHA',
+    'Chicago Bulls': 'CHI',
+    'Cleveland Cavaliers': 'CLE',
+    'Dallas Mavericks': 'DAL',
+    'Denver Nuggets': 'DEN',
+    'Detroit Pistons': 'DET',
+    'Golden State Warriors': 'GSW',
+    'Houston Rockets': 'HOU',
+    'Indiana Pacers': 'IND',
+    'LA Clippers': 'LAC',
+    'Los Angeles Clippers': 'LAC',
+    'Los Angeles Lakers': 'LAL',
+    'Memphis Grizzlies': 'MEM',
+    'Miami Heat': 'MIA',
+    'Milwaukee Bucks': 'MIL',
+    'Minnesota Timberwolves': 'MIN',
+    'New Orleans Pelicans': 'NOP',
+    'New York Knicks': 'NYK',
+    'Oklahoma City Thunder': 'OKC',
+    'Orlando Magic': 'ORL',
+    'Philadelphia 76ers': 'PHI',
+    'Phoenix Suns': 'PHX',
+    'Portland Trail Blazers': 'POR',
+    'Sacramento Kings': 'SAC',
+    'San Antonio Spurs': 'SAS',
+    'Toronto Raptors': 'TOR',
+    'Utah Jazz': 'UTA',
+    'Washington Wizards': 'WAS'
+})
+
+
+def _loop_running() -> bool:
+    """True when called from inside a running asyncio event loop"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+@lru_cache(maxsize=128)
+def _team_abbrev(full_name: str) -> str:
+    """Cached TEAM_ABBREV_MAP lookup (falls back to the first three letters)"""
+    return TEAM_ABBREV_MAP.get(full_name, full_name[:3].upper())
+
+
+@lru_cache(maxsize=64)
+def _load_projections(path: str, mtime_ns: int) -> Dict:
+    """
+    Parse a projections file once per (path, mtime) so backfill loops over
+    the same dates skip re-reading; a rewritten file gets a new mtime key.
+    Callers share the returned dict and must not mutate it.
+    """
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())
 
 
 class OutcomeFetcher:
@@ -35,57 +133,83 @@ class OutcomeFetcher:
     ESPN_SCOREBOARD_URL = "https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard"
     ESPN_ODDS_URL = "https://sports.core.api.espn.com/v2/sports/basketball/leagues/nba/events/{event_id}/competitions/{comp_id}/odds"
 
-    # Team abbreviation mapping (ESPN full name → abbreviation)
-    TEAM_ABBREV_MAP = {
-        'Atlanta Hawks': 'ATL',
-        'Boston Celtics': 'BOS',
-        'Brooklyn Nets': 'BKN',
-        'Charlotte Hornets': 'CHA',
-        'Chicago Bulls': 'CHI',
-        'Cleveland Cavaliers': 'CLE',
-        'Dallas Mavericks': 'DAL',
-        'Denver Nuggets': 'DEN',
-        'Detroit Pistons': 'DET',
-        'Golden State Warriors': 'GSW',
-        'Houston Rockets': 'HOU',
-        'Indiana Pacers': 'IND',
-        'LA Clippers': 'LAC',
-        'Los Angeles Clippers': 'LAC',
-        'Los Angeles Lakers': 'LAL',
-        'Memphis Grizzlies': 'MEM',
-        'Miami Heat': 'MIA',
-        'Milwaukee Bucks': 'MIL',
-        'Minnesota Timberwolves': 'MIN',
-        'New Orleans Pelicans': 'NOP',
-        'New York Knicks': 'NYK',
-        'Oklahoma City Thunder': 'OKC',
-        'Orlando Magic': 'ORL',
-        'Philadelphia 76ers': 'PHI',
-        'Phoenix Suns': 'PHX',
-        'Portland Trail Blazers': 'POR',
-        'Sacramento Kings': 'SAC',
-        'San Antonio Spurs': 'SAS',
-        'Toronto Raptors': 'TOR',
-        'Utah Jazz': 'UTA',
-        'Washington Wizards': 'WAS'
-    }
-
-    def __init__(self, project_root: str = None):
+    # Odds providers in order of preference (others only as a last resort)
+    PROVIDER_PRIORITY = ('ESPN BET', 'Caesars Sportsbook', 'consensus')
+    _PROVIDER_RANK = {name: i for i, name in enumerate(PROVIDER_PRIORITY)}
+
+    # Minimum seconds between ESPN request starts (~4/s) - ESPN throttles
+    # bursts and resets connections mid-stream
+    REQUEST_INTERVAL = 0.25
+
+    # Scoreboards larger than this are stream-parsed with ijson (if installed)
+    SCOREBOARD_STREAM_BYTES = 2_000_000
+
+    # Concurrent odds requests when fetching a whole slate
+    MAX_ODDS_CONNECTIONS = 8
+
+    # Retry policy shared by the requests session and the async odds client
+    RETRY_TOTAL = 3
+    RETRY_BACKOFF = 0.5
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    # Kept as a class attribute for existing callers
+    TEAM_ABBREV_MAP = TEAM_ABBREV_MAP
+
+    def __init__(self, project_root: str = None, session: Optional[requests.Session] = None):
         """
         Initialize outcome fetcher
 
         Args:
             project_root: Path to project root (default: parent of this file)
+            session: Shared requests session to reuse; a private pooled one
+                with retries is created if omitted
         """
         if project_root is None:
             project_root = Path(__file__).parent.parent
 
         self.project_root = Path(project_root)
         self.output_dir = self.project_root / 'model_output'
+        self.odds_cache_dir = self.project_root / '.cache' / 'odds'
+
+        # Keep-alive session for the scoreboard and odds hosts, retrying
+        # ESPN's 429/5xx responses with backoff
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=2,
+                pool_maxsize=8,
+                max_retries=Retry(total=self.RETRY_TOTAL,
+                                  backoff_factor=self.RETRY_BACKOFF,
+                                  status_forcelist=list(self.RETRY_STATUSES),
+                                  allowed_methods=['GET'])
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers.update({
+                'User-Agent': 'nba-engine/1.0',
+                'Accept': 'application/json'
+            })
+        self._session = session
+        self._last_call_ts = 0.0
 
     def get_team_abbrev(self, full_name: str) -> str:
         """Get team abbreviation from full name"""
-        return self.TEAM_ABBREV_MAP.get(full_name, full_name[:3].upper())
+        return _team_abbrev(full_name)
+
+    def _pace(self):
+        """Sleep so ESPN requests start at least REQUEST_INTERVAL apart"""
+        delay = self.REQUEST_INTERVAL - (time.monotonic() - self._last_call_ts)
+        if delay > 0:
+            time.sleep(delay)
+        self._last_call_ts = time.monotonic()
+
+    async def _pace_async(self, pace_lock):
+        """Async _pace: requests queue on the lock and start one interval apart"""
+        async with pace_lock:
+            delay = self.REQUEST_INTERVAL - (time.monotonic() - self._last_call_ts)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._last_call_ts = time.monotonic()
 
     def fetch_yesterdays_games(self) -> List[Dict]:
         """
@@ -100,61 +224,195 @@ class OutcomeFetcher:
         url = f"{self.ESPN_SCOREBOARD_URL}?dates={date_str}"
 
         try:
-            response = requests.get(url, timeout=10)
+            self._pace()
+            games = []
+
+            with self._session.get(url, timeout=10, stream=True) as response:
+                response.raise_for_status()
+                size = int(response.headers.get('Content-Length') or 0)
+                if ijson is not None and size > self.SCOREBOARD_STREAM_BYTES:
+                    # Large (multi-day / backfill) payloads: parse events one
+                    # at a time so non-final games are dropped as they stream
+                    response.raw.decode_content = True
+                    events = ijson.items(response.raw, 'events.item', use_float=True)
+                else:
+                    events = orjson.loads(response.content).get('events', [])
+
+                for event in events:
+                    # Only process completed games
+                    status_type = (event.get('status') or {}).get('type') or {}
+                    status = status_type.get('name', '')
+                    if status != 'STATUS_FINAL':
+                        logger.info("  Skipping %s - Status: %s", event.get('name', 'Unknown'), status)
+                        continue
+
+                    competition = event.get('competitions', [{}])[0]
+                    competitors = competition.get('competitors', [])
+
+                    if len(competitors) != 2:
+                        continue
+
+                    # Extract teams and scores
+                    sides = {c.get('homeAway'): c for c in competitors}
+                    home_team = sides.get('home')
+                    away_team = sides.get('away')
+
+                    if not home_team or not away_team:
+                        continue
+
+                    home_name = (home_team.get('team') or {}).get('displayName', '')
+                    away_name = (away_team.get('team') or {}).get('displayName', '')
+                    away_abbrev = self.get_team_abbrev(away_name)
+                    home_abbrev = self.get_team_abbrev(home_name)
+                    home_score = int(home_team.get('score', 0))
+                    away_score = int(away_team.get('score', 0))
+
+                    game_info = {
+                        'event_id': event.get('id'),
+                        'comp_id': competition.get('id'),
+                        'home_team': home_name,
+                        'away_team': away_name,
+                        'home_score': home_score,
+                        'away_score': away_score,
+                        'game_id': f"{away_abbrev}@{home_abbrev}",  # for log rows / display
+                        'game_key': (away_abbrev, home_abbrev),
+                        'date': yesterday.strftime('%Y-%m-%d')
+                    }
+
+                    games.append(game_info)
+
+            return games
+
+        # Streaming reads response.raw directly, so urllib3 read errors and
+        # ijson parse errors arrive unwrapped by requests
+        except (requests.RequestException, ValueError, Urllib3HTTPError, *_IJSON_ERRORS) as e:
+            logger.error("Error fetching scoreboard: %s", e)
+            return []
+
+    def fetch_game_odds(self, event_id: str, comp_id: str) -> Optional[Dict]:
+        """
+        Fetch closing odds for a game from ESPN
+
+        Args:
+            event_id: ESPN event ID
+            comp_id: ESPN competition ID
+
+        Returns:
+            Dict with closing spread and total, or None if unavailable
+        """
+        cached = self._load_cached_odds(event_id)
+        if cached is not None:
+            return cached
+
+        url = self.ESPN_ODDS_URL.format(event_id=event_id, comp_id=comp_id)
+
+        try:
+            self._pace()
+            response = self._session.get(url, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            odds = self._parse_odds(orjson.loads(response.content))
 
-            games = []
+        except (requests.RequestException, ValueError, KeyError) as e:
+            logger.warning("  Warning: Could not fetch odds - %.50s", e)
+            return None
 
-            for event in data.get('events', []):
-                # Only process completed games
-                status = event.get('status', {}).get('type', {}).get('name', '')
-                if status != 'STATUS_FINAL':
-                    print(f"  Skipping {event.get('name', 'Unknown')} - Status: {status}")
-                    continue
+        if odds is not None:
+            self._store_cached_odds(event_id, odds)
+        return odds
 
-                competition = event.get('competitions', [{}])[0]
-                competitors = competition.get('competitors', [])
+    def _odds_cache_path(self, event_id: str) -> Path:
+        """Cache file for a final game's closing odds"""
+        return self.odds_cache_dir / f"{event_id}.json"
 
-                if len(competitors) != 2:
-                    continue
+    def _load_cached_odds(self, event_id: str) -> Optional[Dict]:
+        """
+        Load closing odds saved by an earlier run
 
-                # Extract teams and scores
-                home_team = next((c for c in competitors if c.get('homeAway') == 'home'), None)
-                away_team = next((c for c in competitors if c.get('homeAway') == 'away'), None)
+        Args:
+            event_id: ESPN event ID
 
-                if not home_team or not away_team:
-                    continue
+        Returns:
+            Cached odds dict, or None on a miss
+        """
+        try:
+            with open(self._odds_cache_path(event_id), 'rb') as f:
+                return orjson.loads(f.read())
+        except (OSError, ValueError):
+            return None
 
-                home_name = home_team.get('team', {}).get('displayName', '')
-                away_name = away_team.get('team', {}).get('displayName', '')
-                home_score = int(home_team.get('score', 0))
-                away_score = int(away_team.get('score', 0))
+    def _store_cached_odds(self, event_id: str, odds: Dict):
+        """
+        Save closing odds for a final game (they never change afterwards)
 
-                game_info = {
-                    'event_id': event.get('id'),
-                    'comp_id': competition.get('id'),
-                    'home_team': home_name,
-                    'away_team': away_name,
-                    'home_score': home_score,
-                    'away_score': away_score,
-                    'game_id': f"{self.get_team_abbrev(away_name)}@{self.get_team_abbrev(home_name)}",
-                    'date': yesterday.strftime('%Y-%m-%d')
-                }
+        Args:
+            event_id: ESPN event ID
+            odds: Dict with spread and total
+        """
+        cache_file = self._odds_cache_path(event_id)
+        tmp_file = cache_file.with_suffix('.tmp')
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, 'w') as f:
+                json.dump(odds, f)
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass  # the cache is only an accelerator
+
+    @classmethod
+    def _parse_odds(cls, data: Dict) -> Optional[Dict]:
+        """
+        Pull the closing spread and total out of an ESPN odds payload
 
-                games.append(game_info)
+        Providers are ranked by PROVIDER_PRIORITY; any other provider with
+        both lines is used only if none of the preferred ones has them.
 
-            return games
+        Args:
+            data: Parsed ESPN odds response
 
-        except requests.RequestException as e:
-            print(f"Error fetching scoreboard: {e}")
-            return []
+        Returns:
+            Dict with closing spread and total, or None if unavailable
+        """
+        # ESPN odds format: data['items'][0] contains odds providers
+        items = data.get('items', [])
 
-    def fetch_game_odds(self, event_id: str, comp_id: str) -> Optional[Dict]:
+        if not items:
+            return None
+
+        rank = cls._PROVIDER_RANK
+        worst = len(rank)
+        best = None
+        best_rank = worst + 1
+
+        for item in items:
+            # Get actual spread and total (not betting juice)
+            spread = item.get('spread')  # Actual spread line
+            over_under = item.get('overUnder')  # Actual total
+
+            if spread is None or over_under is None:
+                continue
+
+            item_rank = rank.get((item.get('provider') or {}).get('name'), worst)
+            if item_rank < best_rank:
+                best, best_rank = (spread, over_under), item_rank
+                if item_rank == 0:
+                    break  # top provider found, no need to scan further
+
+        if best is None:
+            return None
+
+        return {
+            'spread': float(best[0]),  # Negative = home favored
+            'total': float(best[1])
+        }
+
+    async def _fetch_game_odds_async(self, client, pace_lock, event_id: str,
+                                     comp_id: str) -> Optional[Dict]:
         """
-        Fetch closing odds for a game from ESPN
+        Async twin of fetch_game_odds on a shared httpx.AsyncClient
 
         Args:
+            client: Open httpx.AsyncClient
+            pace_lock: asyncio.Lock shared by the batch for request pacing
             event_id: ESPN event ID
             comp_id: ESPN competition ID
 
@@ -164,33 +422,75 @@ class OutcomeFetcher:
         url = self.ESPN_ODDS_URL.format(event_id=event_id, comp_id=comp_id)
 
         try:
-            response = requests.get(url, timeout=10)
+            # Connect errors are retried by the transport; 429/5xx get the
+            # same backoff the requests session applies
+            for attempt in range(self.RETRY_TOTAL + 1):
+                await self._pace_async(pace_lock)
+                response = await client.get(url)
+                if response.status_code not in self.RETRY_STATUSES or attempt == self.RETRY_TOTAL:
+                    break
+                await asyncio.sleep(self.RETRY_BACKOFF * 2 ** attempt)
             response.raise_for_status()
-            data = response.json()
+            return self._parse_odds(orjson.loads(response.content))
 
-            # ESPN odds format: data['items'][0] contains odds providers
-            items = data.get('items', [])
+        except (httpx.HTTPError, ValueError, KeyError) as e:
+            logger.warning("  Warning: Could not fetch odds - %.50s", e)
+            return None
 
-            if not items:
-                return None
+    async def _gather_odds(self, games: List[Dict]) -> Dict[str, Optional[Dict]]:
+        """Fetch odds for every game concurrently, keyed by event_id"""
+        transport = httpx.AsyncHTTPTransport(
+            retries=self.RETRY_TOTAL,
+            limits=httpx.Limits(max_connections=self.MAX_ODDS_CONNECTIONS)
+        )
+        pace_lock = asyncio.Lock()
+        async with httpx.AsyncClient(timeout=10, transport=transport,
+                                     headers=dict(self._session.headers)) as client:
+            results = await asyncio.gather(*(
+                self._fetch_game_odds_async(client, pace_lock, g['event_id'], g['comp_id'])
+                for g in games
+            ))
+        return {g['event_id']: odds for g, odds in zip(games, results)}
+
+    def fetch_all_odds(self, games: List[Dict]) -> Dict[str, Optional[Dict]]:
+        """
+        Fetch closing odds for a list of games
 
-            # Try to find consensus or first available odds
-            for item in items:
-                # Get actual spread and total (not betting juice)
-                spread = item.get('spread', None)  # Actual spread line
-                over_under = item.get('overUnder', None)  # Actual total
+        Games with odds cached on disk are served without a request; the
+        rest run concurrently when httpx is installed, otherwise
+        sequentially through fetch_game_odds. The concurrent path uses
+        asyncio.run, so when called from inside a running event loop the
+        games are fetched sequentially as well.
 
-                if spread is not None and over_under is not None:
-                    return {
-                        'spread': float(spread),  # Negative = home favored
-                        'total': float(over_under)
-                    }
+        Args:
+            games: Game dicts from fetch_yesterdays_games
 
-            return None
+        Returns:
+            Dict of event_id → odds dict (or None if unavailable)
+        """
+        odds_by_id = {}
+        missing = []
+        for g in games:
+            cached = self._load_cached_odds(g['event_id'])
+            if cached is None:
+                missing.append(g)
+            else:
+                odds_by_id[g['event_id']] = cached
 
-        except (requests.RequestException, ValueError, KeyError) as e:
-            print(f"  Warning: Could not fetch odds - {str(e)[:50]}")
-            return None
+        if not missing:
+            return odds_by_id
+
+        if httpx is None or _loop_running():
+            for g in missing:
+                odds_by_id[g['event_id']] = self.fetch_game_odds(g['event_id'], g['comp_id'])
+            return odds_by_id
+
+        fetched = asyncio.run(self._gather_odds(missing))
+        for event_id, odds in fetched.items():
+            if odds is not None:
+                self._store_cached_odds(event_id, odds)
+        odds_by_id.update(fetched)
+        return odds_by_id
 
     def load_model_predictions(self, date: str) -> Optional[Dict]:
         """
@@ -205,19 +505,19 @@ class OutcomeFetcher:
         prediction_file = self.output_dir / f"{date}_projections.json"
 
         if not prediction_file.exists():
-            print(f"  Prediction file not found: {prediction_file}")
+            logger.info("  Prediction file not found: %s", prediction_file)
             return None
 
         try:
-            with open(prediction_file, 'r') as f:
-                return json.load(f)
+            return _load_projections(str(prediction_file), prediction_file.stat().st_mtime_ns)
 
         except (json.JSONDecodeError, IOError) as e:
-            print(f"  Error loading predictions: {e}")
+            logger.error("  Error loading predictions: %s", e)
             return None
 
     def determine_spread_correctness(self, game_info: Dict, model_spread: float,
-                                     market_spread: float) -> Tuple[bool, str]:
+                                     market_spread: float,
+                                     edge_abs: Optional[float] = None) -> Tuple[bool, str]:
         """
         Determine if spread prediction was correct
 
@@ -225,6 +525,7 @@ class OutcomeFetcher:
             game_info: Game info dict with scores
             model_spread: Model's projected spread (negative = home favored)
             market_spread: Market spread (negative = home favored)
+            edge_abs: abs(market_spread - model_spread) if the caller has it
 
         Returns:
             Tuple of (was_correct, notes)
@@ -250,11 +551,12 @@ class OutcomeFetcher:
             ats_covered = ats_margin < 0  # Away covered if margin is negative
 
         # Determine model pick based on edge
-        model_edge = market_spread - model_spread
+        if edge_abs is None:
+            edge_abs = abs(market_spread - model_spread)
 
-        if abs(model_edge) < 1.0:
+        if edge_abs < 1.0:
             # Edge too small - no clear pick
-            return False, f"Edge too small ({model_edge:.1f})"
+            return False, f"Edge too small ({market_spread - model_spread:.1f})"
 
         # Model pick
         if model_spread < market_spread:
@@ -275,7 +577,8 @@ class OutcomeFetcher:
         return correct, notes
 
     def determine_total_correctness(self, game_info: Dict, model_total: float,
-                                    market_total: float) -> Tuple[bool, str]:
+                                    market_total: float,
+                                    edge_abs: Optional[float] = None) -> Tuple[bool, str]:
         """
         Determine if total prediction was correct
 
@@ -283,6 +586,7 @@ class OutcomeFetcher:
             game_info: Game info dict with scores
             model_total: Model's projected total
             market_total: Market total
+            edge_abs: abs(model_total - market_total) if the caller has it
 
         Returns:
             Tuple of (was_correct, notes)
@@ -292,11 +596,12 @@ class OutcomeFetcher:
         actual_total = home_score + away_score
 
         # Model edge
-        model_edge = model_total - market_total
+        if edge_abs is None:
+            edge_abs = abs(model_total - market_total)
 
-        if abs(model_edge) < 2.0:
+        if edge_abs < 2.0:
             # Edge too small - no clear pick
-            return False, f"Edge too small ({model_edge:.1f})"
+            return False, f"Edge too small ({model_total - market_total:.1f})"
 
         # Model pick
         if model_total > market_total:
@@ -316,13 +621,62 @@ class OutcomeFetcher:
 
         return correct, notes
 
-    def classify_pick_type(self, edge: float, is_spread: bool,
+    @staticmethod
+    def evaluate_games_vectorized(games) -> Dict[str, np.ndarray]:
+        """
+        Vectorized determine_spread/total_correctness for backfills
+
+        Same rules as the per-game methods, applied to whole columns at once.
+        Daily single-slate runs keep using evaluate_game.
+
+        Args:
+            games: DataFrame (or dict of arrays) with columns home_score,
+                away_score, model_spread, market_spread, model_total,
+                market_total
+
+        Returns:
+            Dict of arrays aligned with the input rows:
+                spread_pick / total_pick: edge met the logging threshold
+                spread_correct / total_correct: pick won (False where no pick)
+                spread_edge / total_edge: signed edges
+        """
+        home = np.asarray(games['home_score'], dtype=float)
+        away = np.asarray(games['away_score'], dtype=float)
+        model_spread = np.asarray(games['model_spread'], dtype=float)
+        market_spread = np.asarray(games['market_spread'], dtype=float)
+        model_total = np.asarray(games['model_total'], dtype=float)
+        market_total = np.asarray(games['market_total'], dtype=float)
+
+        # Spread: ATS margin against the market line, model side by edge sign
+        ats_margin = (home - away) + market_spread
+        spread_edge = market_spread - model_spread
+        spread_pick = np.abs(spread_edge) >= 1.0
+        spread_correct = np.where(model_spread < market_spread, ats_margin > 0, ats_margin < 0)
+
+        # Total: over when the model is above the market
+        actual_total = home + away
+        total_edge = model_total - market_total
+        total_pick = np.abs(total_edge) >= 2.0
+        total_correct = np.where(model_total > market_total,
+                                 actual_total > market_total,
+                                 actual_total < market_total)
+
+        return {
+            'spread_pick': spread_pick,
+            'spread_correct': spread_correct & spread_pick,
+            'spread_edge': spread_edge,
+            'total_pick': total_pick,
+            'total_correct': total_correct & total_pick,
+            'total_edge': total_edge
+        }
+
+    def classify_pick_type(self, edge_abs: float, is_spread: bool,
                           model_line: float, market_line: float) -> str:
         """
         Classify pick type based on edge size and direction
 
         Args:
-            edge: Edge in points (abs value)
+            edge_abs: Edge in points (abs value, as computed by the caller)
             is_spread: True if spread, False if total
             model_line: Model's line
             market_line: Market line
@@ -330,8 +684,6 @@ class OutcomeFetcher:
         Returns:
             Pick type string
         """
-        edge_abs = abs(edge)
-
         if is_spread:
             # Check if favorite flipped
             model_fav_home = model_line < 0
@@ -340,19 +692,15 @@ class OutcomeFetcher:
             if model_fav_home != market_fav_home:
                 return 'flipped_favorite'
 
-            # Big edge
-            if edge_abs >= 4.0:
+            # Small edges default to dog value; 2-4 pts split by market side
+            if edge_abs < 2.0:
+                return 'spread_dog_value'
+            elif edge_abs < 4.0:
+                # Market has this team as dog → dog value, else small favorite
+                return 'spread_dog_value' if market_line > 0 else 'spread_fav_small'
+            else:
                 return 'spread_big_edge'
 
-            # Small favorite or underdog value
-            if edge_abs >= 2.0:
-                if market_line > 0:  # Market has this team as dog
-                    return 'spread_dog_value'
-                else:
-                    return 'spread_fav_small'
-
-            return 'spread_dog_value'  # Default for spreads
-
         else:  # Total
             model_over = model_line > market_line
 
@@ -428,13 +776,13 @@ class OutcomeFetcher:
         rows = []
 
         # Extract model predictions
-        model_spread = prediction.get('spread', {}).get('rest_adjusted',
-                                      prediction.get('spread', {}).get('baseline', None))
-        model_total = prediction.get('total', {}).get('pace_adjusted',
-                                     prediction.get('total', {}).get('baseline', None))
+        spread_pred = prediction.get('spread') or {}
+        total_pred = prediction.get('total') or {}
+        model_spread = spread_pred.get('rest_adjusted', spread_pred.get('baseline'))
+        model_total = total_pred.get('pace_adjusted', total_pred.get('baseline'))
 
         if model_spread is None or model_total is None:
-            print(f"  Missing model prediction for {game_info['game_id']}")
+            logger.info("  Missing model prediction for %s", game_info['game_id'])
             return None
 
         # Market odds
@@ -442,7 +790,7 @@ class OutcomeFetcher:
         market_total = odds.get('total')
 
         if market_spread is None or market_total is None:
-            print(f"  Missing market odds for {game_info['game_id']}")
+            logger.info("  Missing market odds for %s", game_info['game_id'])
             return None
 
         # Common fields
@@ -451,18 +799,19 @@ class OutcomeFetcher:
 
         # Evaluate SPREAD
         spread_edge = market_spread - model_spread
-        if abs(spread_edge) >= 1.0:  # Only log if meaningful edge
+        spread_edge_abs = abs(spread_edge)
+        if spread_edge_abs >= 1.0:  # Only log if meaningful edge
             spread_correct, spread_notes = self.determine_spread_correctness(
-                game_info, model_spread, market_spread
+                game_info, model_spread, market_spread, spread_edge_abs
             )
 
-            pick_type = self.classify_pick_type(spread_edge, True, model_spread, market_spread)
+            pick_type = self.classify_pick_type(spread_edge_abs, True, model_spread, market_spread)
 
             rows.append({
                 'date': game_info['date'],
                 'game_id': game_info['game_id'],
                 'pick_type': pick_type,
-                'edge_points': round(abs(spread_edge), 2),
+                'edge_points': round(spread_edge_abs, 2),
                 'model_line': round(model_spread, 1),
                 'market_line': round(market_spread, 1),
                 'result_correct': spread_correct,
@@ -473,18 +822,19 @@ class OutcomeFetcher:
 
         # Evaluate TOTAL
         total_edge = model_total - market_total
-        if abs(total_edge) >= 2.0:  # Only log if meaningful edge
+        total_edge_abs = abs(total_edge)
+        if total_edge_abs >= 2.0:  # Only log if meaningful edge
             total_correct, total_notes = self.determine_total_correctness(
-                game_info, model_total, market_total
+                game_info, model_total, market_total, total_edge_abs
             )
 
-            pick_type = self.classify_pick_type(total_edge, False, model_total, market_total)
+            pick_type = self.classify_pick_type(total_edge_abs, False, model_total, market_total)
 
             rows.append({
                 'date': game_info['date'],
                 'game_id': game_info['game_id'],
                 'pick_type': pick_type,
-                'edge_points': round(abs(total_edge), 2),
+                'edge_points': round(total_edge_abs, 2),
                 'model_line': round(model_total, 1),
                 'market_line': round(market_total, 1),
                 'result_correct': total_correct,
@@ -499,95 +849,182 @@ class OutcomeFetcher:
         """
         Load existing entries from CSV to avoid duplicates
 
+        The key set is persisted to a pickle sidecar together with the CSV
+        byte size it covers (up to the last complete line). Since the log is append-only, later calls only
+        parse the bytes added since then; a shrunken file or an older mtime
+        forces a full re-read.
+
         Returns:
             Set of tuples (date, game_id, pick_type) already logged
         """
         csv_path = self.project_root / 'model_performance' / 'model_performance_log.csv'
+        sidecar = csv_path.with_suffix('.keys.pkl')
 
         if not csv_path.exists():
             return set()
 
+        try:
+            stat = csv_path.stat()
+        except OSError:
+            return set()
+
+        index = None
+        try:
+            with open(sidecar, 'rb') as f:
+                index = pickle.load(f)
+            if stat.st_size < index['size'] or stat.st_mtime < index['mtime']:
+                index = None  # log was rewritten, not appended to
+        except Exception:
+            index = None
+
+        if index is not None and stat.st_size == index['size']:
+            return index['keys']
+
         existing = set()
         try:
-            import csv
-            with open(csv_path, 'r') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    key = (row['date'], row['game_id'], row['pick_type'])
-                    existing.add(key)
+            start = index['size'] if index is not None else 0
+            with open(csv_path, 'rb') as f:
+                # Resume after the rows the sidecar already covers
+                f.seek(start)
+                data = f.read()
+
+            # Only consume complete lines; a row the logger is still writing
+            # is picked up (and covered by the sidecar) on a later call
+            end = data.rfind(b'\n') + 1
+            reader = csv.reader(io.StringIO(data[:end].decode('utf-8'), newline=''))
+            size = start + end
+
+            if index is not None:
+                existing = index['keys']
+                di, gi, pi = index['columns']
+            else:
+                header = next(reader)
+                di = header.index('date')
+                gi = header.index('game_id')
+                pi = header.index('pick_type')
+            existing.update((row[di], row[gi], row[pi]) for row in reader if row)
         except Exception:
-            pass
+            return existing
+
+        try:
+            tmp_path = sidecar.with_suffix('.tmp')
+            with open(tmp_path, 'wb') as f:
+                pickle.dump({
+                    'size': size,
+                    'mtime': stat.st_mtime,
+                    'columns': (di, gi, pi),
+                    'keys': existing
+                }, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, sidecar)
+        except OSError:
+            pass  # the sidecar is only an accelerator
 
         return existing
 
+    @staticmethod
+    def _covers_both_markets(pick_types) -> bool:
+        """True if the logged pick types include a spread pick and a total pick"""
+        has_total = has_spread = False
+        for pick_type in pick_types:
+            if pick_type.startswith('total_'):
+                has_total = True
+            else:
+                has_spread = True  # spread_* and flipped_favorite
+        return has_total and has_spread
+
     def update_performance_log(self):
         """
         Main function: Fetch yesterday's games, evaluate predictions, log results
         """
-        print("="*80)
-        print("NBA MODEL OUTCOME FETCHER")
-        print("="*80)
+        logger.info(_BANNER)
+        logger.info("NBA MODEL OUTCOME FETCHER")
+        logger.info(_BANNER)
 
         # Load existing entries to avoid duplicates
         existing_entries = self.get_existing_entries()
         if existing_entries:
-            print(f"\n[0] Found {len(existing_entries)} existing entries in performance log")
+            logger.info("\n[0] Found %d existing entries in performance log", len(existing_entries))
 
         # Fetch yesterday's games
-        print("\n[1] Fetching yesterday's completed games...")
+        logger.info("\n[1] Fetching yesterday's completed games...")
         games = self.fetch_yesterdays_games()
 
         if not games:
-            print("  No completed games found for yesterday")
+            logger.info("  No completed games found for yesterday")
             return
 
-        print(f"  ✓ Found {len(games)} completed game(s)")
+        logger.info("  ✓ Found %d completed game(s)", len(games))
 
         # Get yesterday's date for prediction file
         yesterday = datetime.now() - timedelta(days=1)
         date_str = yesterday.strftime('%Y-%m-%d')
 
         # Load model predictions
-        print(f"\n[2] Loading model predictions for {date_str}...")
+        logger.info("\n[2] Loading model predictions for %s...", date_str)
         predictions = self.load_model_predictions(date_str)
 
         if not predictions:
-            print("  No prediction file found - cannot evaluate")
+            logger.info("  No prediction file found - cannot evaluate")
             return
 
-        print(f"  ✓ Loaded predictions for {len(predictions.get('games', []))} game(s)")
+        logger.info("  ✓ Loaded predictions for %d game(s)", len(predictions.get('games', [])))
+
+        # Index predictions by (away, home) abbreviation once instead of
+        # scanning per game
+        abbrev = self.get_team_abbrev
+        pred_by_key = {
+            (abbrev(p.get('away_team', '')), abbrev(p.get('home_team', ''))): p
+            for p in reversed(predictions.get('games', []))
+        }
+
+        # Pick types already logged per (date, game_id); games with both a
+        # spread and a total pick on file skip the odds request and evaluation
+        logged_by_game = {}
+        for entry_date, entry_game_id, entry_pick_type in existing_entries:
+            logged_by_game.setdefault((entry_date, entry_game_id), set()).add(entry_pick_type)
+
+        fully_logged = {
+            (g['date'], g['game_id']) for g in games
+            if self._covers_both_markets(logged_by_game.get((g['date'], g['game_id']), ()))
+        }
+
+        # Fetch odds up front (concurrent when possible), only for games that
+        # have a prediction and still need evaluating
+        odds_by_id = self.fetch_all_odds([
+            g for g in games
+            if g['game_key'] in pred_by_key and (g['date'], g['game_id']) not in fully_logged
+        ])
 
         # Process each game
-        print(f"\n[3] Evaluating model performance...")
-        total_logged = 0
+        logger.info("\n[3] Evaluating model performance...")
         total_skipped = 0
+        new_rows = []
 
         for game in games:
-            print(f"\n  Processing: {game['game_id']}")
-            print(f"    Final Score: {game['away_team']} {game['away_score']} @ "
-                  f"{game['home_team']} {game['home_score']}")
+            logger.info("\n  Processing: %s", game['game_id'])
+            logger.info("    Final Score: %s %d @ %s %d", game['away_team'], game['away_score'],
+                        game['home_team'], game['home_score'])
+
+            game_key = (game['date'], game['game_id'])
+            if game_key in fully_logged:
+                total_skipped += len(logged_by_game[game_key])
+                logger.info("    ⊘ Skipped: spread and total already logged")
+                continue
 
             # Find matching prediction
-            prediction = None
-            for pred in predictions.get('games', []):
-                pred_game_id = f"{self.get_team_abbrev(pred.get('away_team', ''))}@" \
-                              f"{self.get_team_abbrev(pred.get('home_team', ''))}"
-                if pred_game_id == game['game_id']:
-                    prediction = pred
-                    break
+            prediction = pred_by_key.get(game['game_key'])
 
             if not prediction:
-                print(f"    ⚠ No prediction found")
+                logger.info("    ⚠ No prediction found")
                 continue
 
-            # Fetch odds
-            odds = self.fetch_game_odds(game['event_id'], game['comp_id'])
+            odds = odds_by_id.get(game['event_id'])
 
             if not odds:
-                print(f"    ⚠ No odds available")
+                logger.info("    ⚠ No odds available")
                 continue
 
-            print(f"    Market: Spread={odds['spread']:+.1f}, Total={odds['total']:.1f}")
+            logger.info("    Market: Spread=%+.1f, Total=%.1f", odds['spread'], odds['total'])
 
             # Evaluate and log
             rows = self.evaluate_game(game, prediction, odds)
@@ -599,25 +1036,33 @@ class OutcomeFetcher:
 
                     if entry_key in existing_entries:
                         total_skipped += 1
-                        print(f"    ⊘ Skipped: {row['pick_type']} (already logged)")
+                        logger.info("    ⊘ Skipped: %s (already logged)", row['pick_type'])
                     else:
-                        log_model_performance(row)
+                        new_rows.append(row)
                         existing_entries.add(entry_key)  # Track it
-                        total_logged += 1
-                        print(f"    ✓ Logged: {row['pick_type']} "
-                              f"({'CORRECT' if row['result_correct'] else 'INCORRECT'})")
+                        logger.info("    ✓ Queued: %s (%s)", row['pick_type'],
+                                    'CORRECT' if row['result_correct'] else 'INCORRECT')
             else:
-                print(f"    ⚠ No edges met threshold")
+                logger.info("    ⚠ No edges met threshold")
+
+        # Append every new row in one write
+        log_model_performance_bulk(new_rows)
+        total_logged = len(new_rows)
 
-        print(f"\n{'='*80}")
-        print(f"SUMMARY: Logged {total_logged} pick(s) to performance tracker")
+        logger.info("\n%s", _BANNER)
+        logger.info("SUMMARY: Logged %d pick(s) to performance tracker", total_logged)
         if total_skipped > 0:
-            print(f"         Skipped {total_skipped} duplicate(s)")
-        print(f"{'='*80}\n")
+            logger.info("         Skipped %d duplicate(s)", total_skipped)
+        logger.info("%s\n", _BANNER)
 
 
 def main():
-    """Run outcome fetcher"""
+    """Run outcome fetcher (pass --quiet to log warnings and errors only)"""
+    logging.basicConfig(
+        level=logging.WARNING if '--quiet' in sys.argv[1:] else logging.INFO,
+        format='%(message)s',
+        stream=sys.stdout
+    )
     fetcher = OutcomeFetcher()
     fetcher.update_performance_log()
 
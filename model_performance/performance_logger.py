@@ -22,30 +22,94 @@ Usage:
     })
 """
 
+import io
 import os
+import logging
+import re
 import csv
+import queue
+import atexit
+import threading
+from bisect import bisect_right
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, Dict, List
+
+
+logger = logging.getLogger(__name__)
+
+# Valid pick types
+VALID_PICK_TYPES = frozenset({
+    'spread_dog_value',
+    'spread_fav_small',
+    'spread_big_edge',
+    'flipped_favorite',
+    'total_over_value',
+    'total_over_big_edge',
+    'total_under_value',
+    'total_under_big_edge'
+})
+
+# Valid flags
+VALID_VARIANCE_FLAGS = frozenset({'normal', 'high_variance'})
+VALID_INJURY_FLAGS = frozenset({'none', 'minor', 'major'})
+
+# Not defined on Windows
+_O_CLOEXEC = getattr(os, 'O_CLOEXEC', 0)
+
+# Fields every row must provide (notes is optional)
+_REQUIRED_FIELDS = (
+    'date', 'game_id', 'pick_type', 'edge_points',
+    'model_line', 'market_line', 'result_correct',
+    'variance_flag', 'injury_flag'
+)
+
+# Fields that must parse as numbers
+_NUMERIC_FIELDS = ('edge_points', 'model_line', 'market_line')
+
+# Game IDs: two uppercase team abbreviations joined by '@' (e.g. BOS@MIL)
+_GAME_ID_RE = re.compile(r'[A-Z]+@[A-Z]+\Z')
+
+# Confidence bands: <2 low, 2-4 medium, 4-6 high, 6+ elite
+_BAND_EDGES = (2.0, 4.0, 6.0)
+_BANDS = ('low', 'medium', 'high', 'elite')
+
+
+def _escape(value: Any) -> str:
+    """CSV-quote a free-text field only when it needs it (csv.QUOTE_MINIMAL rules)"""
+    text = '' if value is None else str(value)
+    if ',' in text or '"' in text or '\n' in text or '\r' in text:
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+def _format_row(csv_row: List[Any]) -> str:
+    """
+    Render one CSV_HEADER-ordered row as a CSV line
+
+    Only date and notes are free text; every other column is validated or
+    numeric and never needs quoting. Output matches csv.writer's defaults
+    (QUOTE_MINIMAL, \r\n line endings).
+    """
+    (date, game_id, pick_type, edge, model_line, market_line,
+     result_correct, band, variance_flag, injury_flag, notes) = csv_row
+    return (f"{_escape(date)},{game_id},{pick_type},{edge},{model_line},{market_line},"
+            f"{result_correct},{band},{variance_flag},{injury_flag},{_escape(notes)}\r\n")
 
 
 class PerformanceLogger:
-    """Logs model performance without storing game outcomes"""
-
-    # Valid pick types
-    VALID_PICK_TYPES = {
-        'spread_dog_value',
-        'spread_fav_small',
-        'spread_big_edge',
-        'flipped_favorite',
-        'total_over_value',
-        'total_over_big_edge',
-        'total_under_value',
-        'total_under_big_edge'
-    }
+    """
+    Logs model performance without storing game outcomes
+
+    Each instance holds a writer thread, an open file descriptor and an
+    atexit hook until close() is called; use get_logger() for the shared
+    instance, or close() any logger created directly.
+    """
 
-    # Valid flags
-    VALID_VARIANCE_FLAGS = {'normal', 'high_variance'}
-    VALID_INJURY_FLAGS = {'none', 'minor', 'major'}
+    # Kept as class attributes for existing callers
+    VALID_PICK_TYPES = VALID_PICK_TYPES
+    VALID_VARIANCE_FLAGS = VALID_VARIANCE_FLAGS
+    VALID_INJURY_FLAGS = VALID_INJURY_FLAGS
 
     # CSV header
     CSV_HEADER = [
@@ -62,12 +126,23 @@ class PerformanceLogger:
         'notes'
     ]
 
-    def __init__(self, csv_path: str = None):
+    # Most rows the writer thread appends in one write
+    BATCH_SIZE = 25
+
+    # Append buffer; bursts reach the disk in blocks of up to this size
+    WRITE_BUFFER_BYTES = 128 * 1024
+
+    # Pending-row cap; callers block only if the writer falls this far behind
+    QUEUE_SIZE = 10000
+
+    def __init__(self, csv_path: str = None, batch_size: int = None, verbose: bool = False):
         """
         Initialize performance logger
 
         Args:
             csv_path: Path to CSV file (default: model_performance/model_performance_log.csv)
+            batch_size: Max rows per append (default: BATCH_SIZE)
+            verbose: Print a line per logged row and on CSV creation
         """
         if csv_path is None:
             # Get directory of this file
@@ -75,8 +150,40 @@ class PerformanceLogger:
             csv_path = module_dir / 'model_performance_log.csv'
 
         self.csv_path = Path(csv_path)
+        self.verbose = verbose
         self._ensure_csv_exists()
 
+        # (field, predicate, error template) checks applied by _validate_row
+        self._validators = (
+            ('pick_type', VALID_PICK_TYPES.__contains__,
+             "Invalid pick_type: {}. Must be one of: " + ', '.join(VALID_PICK_TYPES)),
+            ('game_id', self._validate_game_id,
+             "Invalid game_id format: {}. Must be TEAM1@TEAM2 (uppercase, no spaces)"),
+            ('variance_flag', VALID_VARIANCE_FLAGS.__contains__,
+             "Invalid variance_flag: {}. Must be one of: " + ', '.join(VALID_VARIANCE_FLAGS)),
+            ('injury_flag', VALID_INJURY_FLAGS.__contains__,
+             "Invalid injury_flag: {}. Must be one of: " + ', '.join(VALID_INJURY_FLAGS)),
+        )
+
+        # One append-only descriptor for the logger's lifetime (never
+        # overwrite); O_APPEND keeps each write at end-of-file even with
+        # other processes appending. Writes are coalesced in a block-sized
+        # buffer that the writer thread flushes whenever the queue runs dry.
+        fd = os.open(self.csv_path, os.O_WRONLY | os.O_APPEND | _O_CLOEXEC)
+        self._out = io.BufferedWriter(io.FileIO(fd, 'w'), buffer_size=self.WRITE_BUFFER_BYTES)
+
+        # Disk writes happen on a background thread fed by this queue, so
+        # callers only pay for a put; each item is a list of CSV rows
+        self._batch_size = batch_size or self.BATCH_SIZE
+        self._queue = queue.Queue(maxsize=self.QUEUE_SIZE)
+        # Last append failure, re-raised to the caller by flush()
+        self._write_error = None
+        self._closed = False
+        self._writer = threading.Thread(target=self._writer_loop,
+                                        name='performance-log-writer', daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
     def _ensure_csv_exists(self):
         """Create CSV with headers if it doesn't exist (never overwrite)"""
         if not self.csv_path.exists():
@@ -88,7 +195,8 @@ class PerformanceLogger:
                 writer = csv.writer(f)
                 writer.writerow(self.CSV_HEADER)
 
-            print(f"✓ Created performance log: {self.csv_path}")
+            if self.verbose:
+                print(f"✓ Created performance log: {self.csv_path}")
 
     def _calculate_confidence_band(self, edge_points: float) -> str:
         """
@@ -100,16 +208,8 @@ class PerformanceLogger:
         Returns:
             Confidence band: 'low', 'medium', 'high', or 'elite'
         """
-        edge_abs = abs(edge_points)
-
-        if edge_abs < 2.0:
-            return 'low'
-        elif edge_abs < 4.0:
-            return 'medium'
-        elif edge_abs < 6.0:
-            return 'high'
-        else:
-            return 'elite'
+        # bisect_right: an edge exactly on a boundary belongs to the band above
+        return _BANDS[bisect_right(_BAND_EDGES, abs(edge_points))]
 
     def _validate_game_id(self, game_id: str) -> bool:
         """
@@ -121,15 +221,7 @@ class PerformanceLogger:
         Returns:
             True if valid format (TEAM1@TEAM2)
         """
-        if '@' not in game_id:
-            return False
-
-        parts = game_id.split('@')
-        if len(parts) != 2:
-            return False
-
-        # Check both parts are uppercase and non-empty
-        return all(part.isupper() and len(part) > 0 for part in parts)
+        return _GAME_ID_RE.match(game_id) is not None
 
     def _validate_row(self, row_dict: Dict[str, Any]) -> None:
         """
@@ -142,49 +234,20 @@ class PerformanceLogger:
             ValueError: If validation fails
         """
         # Check required fields
-        required_fields = [
-            'date', 'game_id', 'pick_type', 'edge_points',
-            'model_line', 'market_line', 'result_correct',
-            'variance_flag', 'injury_flag'
-        ]
-
-        for field in required_fields:
+        for field in _REQUIRED_FIELDS:
             if field not in row_dict:
                 raise ValueError(f"Missing required field: {field}")
 
-        # Validate pick_type
-        if row_dict['pick_type'] not in self.VALID_PICK_TYPES:
-            raise ValueError(
-                f"Invalid pick_type: {row_dict['pick_type']}. "
-                f"Must be one of: {', '.join(self.VALID_PICK_TYPES)}"
-            )
-
-        # Validate game_id format
-        if not self._validate_game_id(row_dict['game_id']):
-            raise ValueError(
-                f"Invalid game_id format: {row_dict['game_id']}. "
-                f"Must be TEAM1@TEAM2 (uppercase, no spaces)"
-            )
-
-        # Validate variance_flag
-        if row_dict['variance_flag'] not in self.VALID_VARIANCE_FLAGS:
-            raise ValueError(
-                f"Invalid variance_flag: {row_dict['variance_flag']}. "
-                f"Must be one of: {', '.join(self.VALID_VARIANCE_FLAGS)}"
-            )
-
-        # Validate injury_flag
-        if row_dict['injury_flag'] not in self.VALID_INJURY_FLAGS:
-            raise ValueError(
-                f"Invalid injury_flag: {row_dict['injury_flag']}. "
-                f"Must be one of: {', '.join(self.VALID_INJURY_FLAGS)}"
-            )
+        # Membership / format checks (schema compiled once in __init__)
+        for field, check, message in self._validators:
+            value = row_dict[field]
+            if not check(value):
+                raise ValueError(message.format(value))
 
         # Validate numeric fields
         try:
-            float(row_dict['edge_points'])
-            float(row_dict['model_line'])
-            float(row_dict['market_line'])
+            for field in _NUMERIC_FIELDS:
+                float(row_dict[field])
         except (ValueError, TypeError):
             raise ValueError("edge_points, model_line, and market_line must be numeric")
 
@@ -209,6 +272,127 @@ class PerformanceLogger:
                 - injury_flag (str): 'none', 'minor', or 'major'
                 - notes (str, optional): Additional notes
 
+        Raises:
+            ValueError: If validation fails or the logger is closed
+        """
+        self._check_open()
+        csv_row = self._to_csv_row(row_dict)
+
+        self._queue.put([csv_row])
+
+        if self.verbose:
+            print(f"✓ Logged performance: {row_dict['game_id']} - {row_dict['pick_type']} ({csv_row[7]})")
+
+    def log_performances(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Log several performance rows with a single append
+
+        Every row is validated before anything is written, so a bad row
+        leaves the CSV untouched.
+
+        Args:
+            rows: List of row dicts (see log_performance)
+
+        Raises:
+            ValueError: If validation fails for any row or the logger is closed
+            OSError: If the append failed
+        """
+        self._check_open()
+        if not rows:
+            return
+
+        csv_rows = [self._to_csv_row(row_dict) for row_dict in rows]
+
+        # An explicit batch is queued as one item and waited for
+        self._queue.put(csv_rows)
+        self.flush()
+
+        if self.verbose:
+            for row_dict, csv_row in zip(rows, csv_rows):
+                print(f"✓ Logged performance: {row_dict['game_id']} - {row_dict['pick_type']} ({csv_row[7]})")
+
+    def flush(self) -> None:
+        """
+        Block until every queued row has been appended to the CSV
+
+        Raises:
+            ValueError: If the logger is closed
+            OSError: If an append failed since the last flush
+        """
+        self._check_open()
+        if self._writer.is_alive():
+            self._queue.join()
+        if self._write_error is not None:
+            error, self._write_error = self._write_error, None
+            raise error
+
+    def close(self) -> None:
+        """Flush pending rows, stop the writer thread and close the log file (atexit)"""
+        atexit.unregister(self.close)
+        self._closed = True
+        # Let get_logger() hand out a fresh instance once the shared one is closed
+        if get_logger.cache_info().currsize and get_logger() is self:
+            get_logger.cache_clear()
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+        if not self._out.closed:
+            self._out.close()
+
+    def _check_open(self) -> None:
+        """Raise if close() has run, since queued rows would never be written"""
+        if self._closed:
+            raise ValueError("PerformanceLogger is closed")
+
+    def _writer_loop(self) -> None:
+        """Drain queued rows in batches and append each batch in one write"""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+
+            pending = list(item)
+            taken = 1
+            stop = False
+            # Pick up whatever else is already queued, up to the batch size
+            while len(pending) < self._batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                taken += 1
+                if item is None:
+                    stop = True
+                    break
+                pending.extend(item)
+
+            try:
+                self._out.write(''.join(map(_format_row, pending)).encode('utf-8'))
+                # Idle: push the buffer to disk before reporting the rows done,
+                # so flush() returning means the rows are in the file
+                if self._queue.empty():
+                    self._out.flush()
+            except OSError as e:
+                logger.warning("⚠ Could not write performance log: %s", e)
+                self._write_error = e
+            finally:
+                for _ in range(taken):
+                    self._queue.task_done()
+
+            if stop:
+                return
+
+    def _to_csv_row(self, row_dict: Dict[str, Any]) -> List[Any]:
+        """
+        Validate a row dict and convert it to CSV column order
+
+        Args:
+            row_dict: Dictionary with row data
+
+        Returns:
+            List of values in CSV_HEADER order
+
         Raises:
             ValueError: If validation fails
         """
@@ -222,13 +406,13 @@ class PerformanceLogger:
         result_correct_str = 'TRUE' if row_dict['result_correct'] else 'FALSE'
 
         # Prepare row for CSV
-        csv_row = [
+        return [
             row_dict['date'],
             row_dict['game_id'],
             row_dict['pick_type'],
-            round(row_dict['edge_points'], 2),
-            round(row_dict['model_line'], 2),
-            round(row_dict['market_line'], 2),
+            f"{row_dict['edge_points']:.2f}",
+            f"{row_dict['model_line']:.2f}",
+            f"{row_dict['market_line']:.2f}",
             result_correct_str,
             confidence_band,
             row_dict['variance_flag'],
@@ -236,24 +420,11 @@ class PerformanceLogger:
             row_dict.get('notes', '')  # Optional field
         ]
 
-        # Append to CSV (never overwrite)
-        with open(self.csv_path, 'a', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(csv_row)
-
-        print(f"✓ Logged performance: {row_dict['game_id']} - {row_dict['pick_type']} ({confidence_band})")
-
-
-# Global logger instance
-_logger = None
-
 
+@lru_cache(maxsize=1)
 def get_logger() -> PerformanceLogger:
     """Get or create global logger instance"""
-    global _logger
-    if _logger is None:
-        _logger = PerformanceLogger()
-    return _logger
+    return PerformanceLogger()
 
 
 def log_model_performance(row_dict: Dict[str, Any]) -> None:
@@ -281,6 +452,17 @@ def log_model_performance(row_dict: Dict[str, Any]) -> None:
     logger.log_performance(row_dict)
 
 
+def log_model_performance_bulk(rows: List[Dict[str, Any]]) -> None:
+    """
+    Public API: Log several performance rows in one file append
+
+    Args:
+        rows: List of row dicts (see PerformanceLogger.log_performance)
+    """
+    if rows:
+        get_logger().log_performances(rows)
+
+
 if __name__ == "__main__":
     # Test the logger
     print("Testing Performance Logger")
@@ -15,24 +15,39 @@ Usage:
 """
 
 import csv
+import io
+import os
+import logging
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+# Valid pick types
+VALID_PICK_TYPES = frozenset({
+    'spread_dog_value',
+    'spread_fav_small',
+    'spread_big_edge',
+    'flipped_favorite',
+    'total_over_value',
+    'total_over_big_edge',
+    'total_under_value',
+    'total_under_big_edge'
+})
+
+
+# Stats used for a pick type with no logged history
+_NO_STATS = {'wins': 0, 'total': 0, 'win_rate': None}
 
 
 class RecommendationEngine:
     """Evaluates picks based on historical performance data"""
 
-    # Valid pick types
-    VALID_PICK_TYPES = {
-        'spread_dog_value',
-        'spread_fav_small',
-        'spread_big_edge',
-        'flipped_favorite',
-        'total_over_value',
-        'total_over_big_edge',
-        'total_under_value',
-        'total_under_big_edge'
-    }
+    # Kept as a class attribute for existing callers
+    VALID_PICK_TYPES = VALID_PICK_TYPES
 
     # Recommendation thresholds
     MIN_EDGE_POINTS = 3.0
@@ -51,54 +66,114 @@ class RecommendationEngine:
             csv_path = module_dir / 'model_performance_log.csv'
 
         self.csv_path = Path(csv_path)
-        self.historical_stats = self._load_historical_stats()
+
+        # Incremental-read state: per-pick-type counters, bytes consumed,
+        # (size, mtime) at the last full read, and header column indices
+        self._totals = Counter()
+        self._wins = Counter()
+        self._last_offset = 0
+        self._watermark = (-1, 0.0)
+        self._columns = None
+
+        # Parsed lazily on first access (see historical_stats)
+        self._historical_stats = None
+
+    @property
+    def historical_stats(self) -> Dict[str, Dict]:
+        """Historical stats by pick type, loaded from the CSV on first use"""
+        if self._historical_stats is None:
+            self._historical_stats = self._load_historical_stats()
+        return self._historical_stats
 
     def _load_historical_stats(self) -> Dict[str, Dict]:
         """
         Load historical win rates by pick type from CSV
 
+        The log is append-only, so per-pick-type counters are kept between
+        calls and only rows added since the last read are parsed. An
+        unchanged file is not read at all; a shrunken file or older mtime
+        resets the counters and re-reads from the top.
+
         Returns:
             Dict mapping pick_type to {win_rate, total, wins}
         """
-        stats = {}
-
-        if not self.csv_path.exists():
-            return stats
-
         try:
-            with open(self.csv_path, 'r') as f:
-                reader = csv.DictReader(f)
-
-                for row in reader:
-                    pick_type = row.get('pick_type')
-                    result_correct = row.get('result_correct', '').upper()
+            stat = self.csv_path.stat()
+        except OSError:
+            return {}
 
-                    if not pick_type or pick_type not in self.VALID_PICK_TYPES:
-                        continue
+        if (stat.st_size, stat.st_mtime) != self._watermark:
+            self._consume_new_rows(stat)
 
-                    # Initialize if first time seeing this pick type
-                    if pick_type not in stats:
-                        stats[pick_type] = {'wins': 0, 'total': 0}
-
-                    stats[pick_type]['total'] += 1
+        # Calculate win rates
+        totals, wins = self._totals, self._wins
+        min_sample = self.MIN_SAMPLE_SIZE
+        return {
+            pick_type: {
+                'wins': wins[pick_type],
+                'total': total,
+                'win_rate': wins[pick_type] / total if total >= min_sample else None
+            }
+            for pick_type, total in totals.items()
+        }
 
-                    if result_correct == 'TRUE':
-                        stats[pick_type]['wins'] += 1
+    def _consume_new_rows(self, stat: os.stat_result):
+        """
+        Add rows appended since the last read to the win/total counters
 
-            # Calculate win rates
-            for pick_type, data in stats.items():
-                total = data['total']
-                wins = data['wins']
+        Args:
+            stat: Current os.stat() of the CSV
+        """
+        if stat.st_size < self._last_offset or stat.st_mtime < self._watermark[1]:
+            # Log was rewritten rather than appended to
+            self._totals = Counter()
+            self._wins = Counter()
+            self._last_offset = 0
+            self._columns = None
+
+        # Count into locals and merge only once the offset is committed, so
+        # a failed read never leaves rows counted that will be read again
+        totals = Counter()
+        wins = Counter()
 
-                if total >= self.MIN_SAMPLE_SIZE:
-                    data['win_rate'] = wins / total
-                else:
-                    data['win_rate'] = None
+        try:
+            with open(self.csv_path, 'rb') as f:
+                f.seek(self._last_offset)
+                data = f.read()
+
+            # Only consume complete lines; a partially written row waits
+            # for the next reload
+            end = data.rfind(b'\n') + 1
+            reader = csv.reader(io.StringIO(data[:end].decode('utf-8'), newline=''))
+
+            if self._columns is None:
+                header = next(reader, None)
+                if not header or 'pick_type' not in header or 'result_correct' not in header:
+                    return  # empty or header-less log: no stats yet
+                self._columns = (header.index('pick_type'), header.index('result_correct'))
+            pi, ri = self._columns
+            width = max(pi, ri)
+
+            for row in reader:
+                # Skip blank and short (malformed) rows individually
+                if len(row) <= width:
+                    continue
+
+                # Positional access; result_correct is only normalized for
+                # rows that are actually counted
+                pick_type = row[pi]
+                if pick_type in VALID_PICK_TYPES:
+                    totals[pick_type] += 1
+                    wins[pick_type] += row[ri].upper() == 'TRUE'
 
         except Exception as e:
-            print(f"Warning: Could not load historical stats - {str(e)[:50]}")
+            logger.warning("Warning: Could not load historical stats - %.50s", e)
+            return
 
-        return stats
+        self._totals.update(totals)
+        self._wins.update(wins)
+        self._last_offset += end
+        self._watermark = (stat.st_size, stat.st_mtime) if end == len(data) else (-1, 0.0)
 
     def evaluate_recommendation(self, pick_type: str, edge_points: float) -> Dict:
         """
@@ -115,8 +190,36 @@ class RecommendationEngine:
                 - historical_win_rate (float or None): Win rate for this pick type
                 - sample_size (int): Number of historical picks of this type
         """
+        return self._evaluate(self.historical_stats, pick_type, edge_points)
+
+    def evaluate_many(self, picks: List[Tuple[str, float]]) -> List[Dict]:
+        """
+        Evaluate several picks against one snapshot of the historical stats
+
+        Args:
+            picks: List of (pick_type, edge_points) tuples
+
+        Returns:
+            List of result dicts (see evaluate_recommendation), in input order
+        """
+        stats_map = self.historical_stats
+        evaluate = self._evaluate
+        return [evaluate(stats_map, pick_type, edge_points) for pick_type, edge_points in picks]
+
+    def _evaluate(self, stats_map: Dict[str, Dict], pick_type: str, edge_points: float) -> Dict:
+        """
+        Recommendation decision for one pick
+
+        Args:
+            stats_map: Historical stats by pick type
+            pick_type: Type of pick (e.g., 'spread_big_edge')
+            edge_points: Edge size in points
+
+        Returns:
+            Result dict (see evaluate_recommendation)
+        """
         # Validate pick type
-        if pick_type not in self.VALID_PICK_TYPES:
+        if pick_type not in VALID_PICK_TYPES:
             return {
                 'recommended': False,
                 'reason': 'invalid pick type',
@@ -125,7 +228,7 @@ class RecommendationEngine:
             }
 
         # Get historical stats for this pick type
-        stats = self.historical_stats.get(pick_type, {'wins': 0, 'total': 0, 'win_rate': None})
+        stats = stats_map.get(pick_type, _NO_STATS)
 
         sample_size = stats['total']
         win_rate = stats['win_rate']
@@ -176,19 +279,13 @@ class RecommendationEngine:
 
     def reload_stats(self):
         """Reload historical stats from CSV (use after new data is logged)"""
-        self.historical_stats = self._load_historical_stats()
-
-
-# Global engine instance
-_engine = None
+        self._historical_stats = None  # re-read lazily on next access
 
 
+@lru_cache(maxsize=1)
 def get_engine() -> RecommendationEngine:
     """Get or create global recommendation engine instance"""
-    global _engine
-    if _engine is None:
-        _engine = RecommendationEngine()
-    return _engine
+    return RecommendationEngine()
 
 
 def evaluate_recommendation(pick_type: str, edge_points: float) -> Dict:
@@ -213,6 +310,23 @@ def evaluate_recommendation(pick_type: str, edge_points: float) -> Dict:
     return engine.evaluate_recommendation(pick_type, edge_points)
 
 
+def evaluate_recommendations_batch(picks: List[Tuple[str, float]]) -> List[Dict]:
+    """
+    Public API: Evaluate several picks in one call
+
+    Args:
+        picks: List of (pick_type, edge_points) tuples
+
+    Returns:
+        List of recommendation dicts, in input order
+
+    Example:
+        results = evaluate_recommendations_batch([('spread_big_edge', 4.5),
+                                                  ('total_over_value', 2.5)])
+    """
+    return get_engine().evaluate_many(picks)
+
+
 def reload_historical_stats():
     """Reload historical stats from CSV (call after new data is logged)"""
     engine = get_engine()
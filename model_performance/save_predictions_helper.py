@@ -9,10 +9,10 @@ from model_performance.save_predictions_helper import save_predictions
 save_predictions(date, games_list)
 """
 
-import json
+import orjson
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict
+from typing import Dict, Iterable, List
 
 
 def save_predictions(date: str, games: List[Dict], output_dir: str = None):
@@ -44,12 +44,56 @@ def save_predictions(date: str, games: List[Dict], output_dir: str = None):
     # Save to JSON
     output_file = output_dir / f"{date}_projections.json"
 
-    with open(output_file, 'w') as f:
-        json.dump(output, f, indent=2)
+    with open(output_file, 'wb') as f:
+        f.write(orjson.dumps(output, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
 
     print(f"✓ Saved predictions to: {output_file}")
 
 
+def save_predictions_stream(date: str, games: Iterable[Dict], output_dir: str = None) -> int:
+    """
+    Stream model predictions to the same JSON file save_predictions writes
+
+    Games are serialized one at a time into a buffered file, so no list of
+    games or full output tree is built. The schema matches save_predictions
+    (date, timestamp, games); only the indentation differs.
+
+    Args:
+        date: Date string (YYYY-MM-DD)
+        games: Iterable of game prediction dicts (a generator is fine)
+        output_dir: Output directory (default: model_output/)
+
+    Returns:
+        Number of games written
+    """
+    if output_dir is None:
+        project_root = Path(__file__).parent.parent
+        output_dir = project_root / 'model_output'
+    else:
+        output_dir = Path(output_dir)
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_file = output_dir / f"{date}_projections.json"
+
+    dumps = orjson.dumps
+    option = orjson.OPT_SERIALIZE_NUMPY
+    count = 0
+
+    with open(output_file, 'wb', buffering=1 << 20) as f:
+        f.write(b'{"date":' + dumps(date)
+                + b',"timestamp":' + dumps(datetime.now().isoformat())
+                + b',"games":[')
+        for game in games:
+            if count:
+                f.write(b',')
+            f.write(dumps(game, option=option))
+            count += 1
+        f.write(b']}')
+
+    print(f"✓ Saved predictions to: {output_file}")
+    return count
+
+
 def format_game_prediction(home_team: str, away_team: str, projection_result: Dict) -> Dict:
     """
     Format a single game prediction for saving
@@ -57,7 +101,7 @@ def format_game_prediction(home_team: str, away_team: str, projection_result: Di
     Args:
         home_team: Home team name
         away_team: Away team name
-        projection_result: Result dict from run_full_pipeline()
+        projection_result: Flat dict of spread/total/injury values for one game
 
     Returns:
         Formatted game dict
@@ -6,7 +6,6 @@ NBA Statistical Projection Model
 
 from nba_api.stats.static import teams
 from nba_api.stats.endpoints import teamdashboardbyshootingsplits
-import pandas as pd
 import requests
 import time
 from datetime import datetime
@@ -143,7 +142,7 @@ class NBAStatisticalModel:
         for category in categories:
             try:
                 data = get_team_dashboard(team_id, last_n=5)
-                team_data['last5'][category] = pd.Series(data.get(category, {}))
+                team_data['last5'][category] = data.get(category, {})
             except Exception as e:
                 print(f"Last5 {team_name} {category} failed: {e}")
                 team_data['last5'][category] = None
@@ -151,14 +150,14 @@ class NBAStatisticalModel:
         for category in categories:
             try:
                 data = get_team_dashboard(team_id, last_n=0)
-                team_data['season'][category] = pd.Series(data.get(category, {}))
+                team_data['season'][category] = data.get(category, {})
             except Exception as e:
                 print(f"Season {team_name} {category} failed: {e}")
                 team_data['season'][category] = None
 
         try:
             data = get_team_dashboard(team_id, last_n=5)
-            team_data['opponent_last5'] = pd.Series(data.get('Opponent', {}))
+            team_data['opponent_last5'] = data.get('Opponent', {})
         except Exception as e:
             print(f"Opponent stats failed: {e}")
             team_data['opponent_last5'] = None
@@ -56,6 +56,37 @@ class PlayerStatsProcessor:
 
         return None
 
+    @staticmethod
+    def _overall_row(endpoint) -> Optional[Dict]:
+        """
+        Read the 'Overall' row of a dashboard's primary result set as a dict
+
+        Uses the raw resultSets JSON so no DataFrame is built for a single row
+
+        Args:
+            endpoint: Loaded nba_api dashboard endpoint instance
+
+        Returns:
+            Dict of header → value, or None if the result set is empty
+        """
+        result_sets = endpoint.get_dict().get('resultSets', [])
+
+        if not result_sets or not result_sets[0]['rowSet']:
+            return None
+
+        headers = result_sets[0]['headers']
+        rows = result_sets[0]['rowSet']
+
+        # Index rows by GROUP_SET once; fall back to the first row if absent
+        if 'GROUP_SET' in headers:
+            group_idx = headers.index('GROUP_SET')
+            by_group = {row[group_idx]: row for row in rows}
+            row = by_group.get('Overall', rows[0])
+        else:
+            row = rows[0]
+
+        return dict(zip(headers, row))
+
     def fetch_player_stats(self, player_name: str) -> Optional[Dict]:
         """
         Fetch required player statistics from NBA API
@@ -81,13 +112,11 @@ class PlayerStatsProcessor:
                 per_mode_detailed='Totals'
             )
 
-            dfs = player_dash.get_data_frames()
+            overall = self._overall_row(player_dash)
 
-            if len(dfs) == 0 or len(dfs[0]) == 0:
+            if overall is None:
                 return None
 
-            overall = dfs[0].iloc[0]
-
             # Extract required stats
             # Note: MIN in Totals mode should be total minutes, but calculate to be safe
             games_played = overall['GP']
@@ -119,13 +148,13 @@ class PlayerStatsProcessor:
                 per_mode_detailed='PerGame'
             )
 
-            last10_dfs = player_dash_last10.get_data_frames()
+            overall_last10 = self._overall_row(player_dash_last10)
 
-            if len(last10_dfs) > 0 and len(last10_dfs[0]) > 0:
-                usage_last10_raw = last10_dfs[0].iloc[0]['USG_PCT']
+            if overall_last10 is not None:
+                usage_last10_raw = overall_last10['USG_PCT']
                 usage_last10_pct = usage_last10_raw * 100 if usage_last10_raw < 1 else usage_last10_raw
 
-                stats['games_played_last_10'] = last10_dfs[0].iloc[0]['GP']
+                stats['games_played_last_10'] = overall_last10['GP']
                 stats['usage_rate_last_10'] = usage_last10_pct
             else:
                 stats['games_played_last_10'] = 0
@@ -50,13 +50,15 @@ class RestAdjustmentModule:
                 season_type_all_star='Regular Season'
             )
 
-            df = game_log.get_data_frames()[0]
+            # Read the raw result set - only the first row is needed, so
+            # skip building a DataFrame for the whole season's log
+            result_set = game_log.get_dict()['resultSets'][0]
 
-            if len(df) == 0:
+            if len(result_set['rowSet']) == 0:
                 return None
 
             # Get the most recent game (first row)
-            last_game = df.iloc[0]
+            last_game = dict(zip(result_set['headers'], result_set['rowSet'][0]))
 
             # Parse game date (format: 'DEC 07, 2025')
             game_date_str = last_game['GAME_DATE']